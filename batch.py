@@ -0,0 +1,145 @@
+import argparse
+import functools
+import glob
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import compiler
+
+# Extensões consideradas programas Pascal quando se indica uma diretoria
+SOURCE_EXTENSIONS = ('.pas', '.txt')
+
+# Extensão dos ficheiros de saída em cada formato (compiler.OUTPUT_FORMATS)
+OUTPUT_EXTENSIONS = {'ewvm': '.vm', 'linked': '.vml', 'bytecode': '.vmb'}
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# Identificação do compilador: versão declarada mais o conteúdo dos módulos,
+# para que qualquer alteração ao compilador invalide a cache
+def compiler_fingerprint():
+    digest = hashlib.sha256(compiler.COMPILER_VERSION.encode())
+    for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, '*.py'))):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Chave da cache para um programa: hash do código fonte e do compilador
+def cache_key(source, fingerprint):
+    digest = hashlib.sha256(fingerprint.encode())
+    digest.update(source)
+    return digest.hexdigest()
+
+
+# Lista os programas a compilar, com o nome relativo usado na saída
+def collect_sources(paths):
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith(SOURCE_EXTENSIONS):
+                        full_path = os.path.join(root, name)
+                        sources.append((full_path, os.path.relpath(full_path, path)))
+        else:
+            sources.append((path, os.path.basename(path)))
+    return sources
+
+
+# Trabalho executado em cada processo do pool. Qualquer erro de um programa
+# (incluindo erros internos do compilador) é devolvido, para não parar o lote
+def compile_job(source, optimize=False, output_format='ewvm'):
+    try:
+        return compiler.compile(source.decode('utf-8'), optimize).output(output_format), None
+    except SyntaxError as error:
+        return None, str(error)
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as out_file:
+        out_file.write(data)
+
+
+# Compila uma lista de programas num pool de processos, reaproveitando a cache
+def compile_batch(paths, output_dir, cache_dir=None, jobs=None, optimize=False, output_format='ewvm'):
+    if cache_dir is None:
+        cache_dir = os.path.join(output_dir, '.vmcache')
+    os.makedirs(cache_dir, exist_ok=True)
+    fingerprint = compiler_fingerprint()
+    if optimize:
+        fingerprint += '-O'
+    fingerprint += '-' + output_format
+    extension = OUTPUT_EXTENSIONS[output_format]
+
+    results = {'compiled': [], 'cached': [], 'failed': []}
+    pending = []
+    for path, name in collect_sources(paths):
+        with open(path, 'rb') as f:
+            source = f.read()
+        output = os.path.join(output_dir, os.path.splitext(name)[0] + extension)
+        cached = os.path.join(cache_dir, cache_key(source, fingerprint) + extension)
+        if os.path.exists(cached):
+            data = read_file(cached)
+            if not os.path.exists(output) or read_file(output) != data:
+                write_file(output, data)
+            results['cached'].append(path)
+        else:
+            pending.append((path, source, output, cached))
+
+    # Cada resultado é escrito assim que chega; um processo que morre (por
+    # exemplo sem memória) só faz falhar os programas que ficaram sem resultado
+    if pending:
+        workers = jobs or os.cpu_count() or 1
+        compile_one = functools.partial(compile_job, optimize=optimize, output_format=output_format)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(compile_one, source): (path, output, cached)
+                       for path, source, output, cached in pending}
+            for future in as_completed(futures):
+                path, output, cached = futures[future]
+                try:
+                    data, error = future.result()
+                except Exception as exception:
+                    data, error = None, f"{type(exception).__name__}: {exception}"
+                if error is not None:
+                    results['failed'].append((path, error))
+                    continue
+                write_file(cached, data)
+                write_file(output, data)
+                results['compiled'].append(path)
+        results['failed'].sort()
+    return results
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Compilação em lote de programas Pascal")
+    arg_parser.add_argument("paths", nargs='+', help="ficheiros ou diretorias a compilar")
+    arg_parser.add_argument("-o", "--output-dir", default="build", help="diretoria de saída (build por omissão)")
+    arg_parser.add_argument("--cache-dir", help="diretoria da cache (OUTPUT_DIR/.vmcache por omissão)")
+    arg_parser.add_argument("-j", "--jobs", type=int, help="número de processos")
+    arg_parser.add_argument("-O", "--optimize", action="store_true", help="otimizar o código VM gerado")
+    arg_parser.add_argument("--format", choices=compiler.OUTPUT_FORMATS, default='ewvm',
+                            help="formato da saída: texto EWVM com rótulos (.vm, por omissão), pré-ligado (.vml) ou bytecode (.vmb)")
+    args = arg_parser.parse_args(argv)
+
+    results = compile_batch(args.paths, args.output_dir, args.cache_dir, args.jobs, args.optimize, args.format)
+    for path, error in results['failed']:
+        print(f"{path}: {error}")
+    print(f"{len(results['compiled'])} compilados, {len(results['cached'])} em cache, "
+          f"{len(results['failed'])} com erros")
+    if results['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
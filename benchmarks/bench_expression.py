@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compiler import Compiler, parse
+
+# Operadores usados em rotação para gerar a expressão (tipos inteiro e real)
+OPERATORS = ['+', '-', '*', '+', 'div']
+OPERANDS = ['a', 'b', 'r', '3', 'c']
+
+
+# Gera um programa com uma atribuição cuja expressão tem o número de termos indicado
+def generate_source(terms):
+    parts = [OPERANDS[0]]
+    for i in range(1, terms):
+        parts.append(OPERATORS[i % len(OPERATORS)])
+        parts.append(OPERANDS[i % len(OPERANDS)])
+    expression = " ".join(parts)
+    return (f"program Bench;\nvar a, b, c, x: integer;\n    r: real;\nbegin\n"
+            f"    x := {expression};\n    writeln({expression})\nend.\n")
+
+
+# Devolve (segundos de parsing, segundos de geração de código) para um programa
+def compile_times(source):
+    start = time.perf_counter()
+    ast = parse(source)
+    parsed = time.perf_counter()
+    Compiler().compile_ast(ast)
+    return parsed - start, time.perf_counter() - parsed
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tempo de compilação de expressões longas")
+    arg_parser.add_argument("--terms", type=int, nargs='+', default=[1250, 2500, 5000, 10000],
+                            help="número de termos das expressões geradas")
+    args = arg_parser.parse_args(argv)
+
+    for terms in args.terms:
+        parse_time, codegen_time = compile_times(generate_source(terms))
+        print(f"{terms:>7} termos: parsing {parse_time:.3f} s, geração de código {codegen_time:.3f} s "
+              f"({codegen_time / terms * 1e6:.1f} µs/termo)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import lexer
+
+# Linhas usadas para gerar programas grandes (mistura de palavras reservadas e identificadores)
+LINES = [
+    "    soma := soma + numeros[indice] * 2;",
+    "    if contador > limite then writeln('Total: ', total) else contador := contador + 1;",
+    "    while (valor <= maximo) and encontrado do valor := valor div 2;",
+    "    for posicao := inicio to fim do resultado := resultado mod 7;",
+    "    formato := endereco - dobro; { comentário }",
+]
+
+
+# Gera o texto de um programa com aproximadamente o número de linhas indicado
+def generate_source(lines):
+    body = "\n".join(LINES[i % len(LINES)] for i in range(lines))
+    return f"program Bench;\nbegin\n{body}\n    fim := 0\nend.\n"
+
+
+# Percorre todos os tokens do texto e devolve (número de tokens, segundos)
+def lex_all(data):
+    local_lexer = lexer.clone()
+    local_lexer.input(data)
+    count = 0
+    start = time.perf_counter()
+    while local_lexer.token() is not None:
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmark do débito do lexer (tokens/s)")
+    arg_parser.add_argument("--lines", type=int, default=200000, help="linhas do programa gerado")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="número de repetições")
+    args = arg_parser.parse_args(argv)
+
+    data = generate_source(args.lines)
+    best = None
+    for _ in range(args.repeat):
+        count, elapsed = lex_all(data)
+        if best is None or elapsed < best:
+            best = elapsed
+    print(f"{len(data) / 1e6:.1f} MB, {count} tokens, {best:.3f} s, {count / best:,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compiler import OUTPUT_FORMATS, compile
+from vm import load_file
+
+
+# Gera um programa com o número de ifs indicado (cada um com rótulos, saltos e uma string)
+def generate_source(statements):
+    lines = ["program Bench;", "var i, x: integer;", "begin", "    x := 0;"]
+    for i in range(statements):
+        lines.append(f"    if x > {i} then writeln('valor {i}: ', x) else x := x + {i};")
+    lines.append("    writeln(x)")
+    lines.append("end.")
+    return "\n".join(lines) + "\n"
+
+
+# Melhor tempo (segundos) de vm.load_file sobre repeat leituras
+def load_time(path, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load_file(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tempo de carregamento do código VM em cada formato de saída")
+    arg_parser.add_argument("--statements", type=int, default=20000, help="número de statements do programa gerado")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="número de leituras de cada ficheiro")
+    args = arg_parser.parse_args(argv)
+
+    program = compile(generate_source(args.statements))
+    with tempfile.TemporaryDirectory() as directory:
+        for output_format in OUTPUT_FORMATS:
+            path = os.path.join(directory, "bench." + output_format)
+            program.write(path, output_format)
+            seconds = load_time(path, args.repeat)
+            print(f"{output_format:>8}: {os.path.getsize(path) / 1024:8.0f} KB, carregado em {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_lexer import LINES
+
+
+# Escreve um programa gerado com aproximadamente o tamanho pedido (em MB)
+def generate_file(path, megabytes):
+    line = ("\n".join(LINES) + "\n").encode()
+    repeats = max(1, int(megabytes * 1e6) // len(line))
+    with open(path, 'wb') as f:
+        f.write(b"program Bench;\nbegin\n")
+        for _ in range(repeats):
+            f.write(line)
+        f.write(b"    fim := 0\nend.\n")
+
+
+# Caminhos medidos: só os tokens (texto lido de uma vez ou em streaming) e o
+# parse completo, que constrói a AST (compiler.parse com o texto ou com o path)
+MODES = ('read', 'stream', 'parse-read', 'parse')
+
+
+# Caminho executado num processo filho: percorre os tokens (ou faz o parse) e termina
+def run_path(mode, path):
+    sys.path.insert(0, ROOT)
+    from lexer import lexer, tokenize_file
+    if mode.startswith('parse'):
+        from compiler import parse
+        if mode == 'parse':
+            ast = parse(path=path)
+        else:
+            with open(path, 'r') as f:
+                ast = parse(f.read())
+        print(len(ast.block.statements))
+        return
+    if mode == 'read':
+        with open(path, 'r') as f:
+            data = f.read()
+        local_lexer = lexer.clone()
+        local_lexer.input(data)
+        tokens = iter(local_lexer.token, None)
+    else:
+        tokens = tokenize_file(path)
+    count = sum(1 for _ in tokens)
+    print(count)
+
+
+# Corre um caminho num processo separado e devolve (tokens ou statements, segundos, pico de RSS em MB)
+def measure(mode, path):
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, __file__, '--run', mode, path], stdout=subprocess.PIPE)
+    output = child.stdout.read()
+    _, _, usage = os.wait4(child.pid, 0)
+    elapsed = time.perf_counter() - start
+    return int(output), elapsed, usage.ru_maxrss / 1024
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Pico de memória: f.read() + lexer.input() vs. tokenize_file(), "
+                                                     "só os tokens e com o parse completo")
+    arg_parser.add_argument("--mb", type=float, default=100, help="tamanho do programa gerado em MB")
+    arg_parser.add_argument("--modes", nargs='+', choices=MODES, default=MODES, help="caminhos a medir")
+    arg_parser.add_argument("--run", nargs=2, metavar=("MODE", "FILE"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args(argv)
+
+    if args.run:
+        run_path(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.pas')
+        generate_file(path, args.mb)
+        print(f"ficheiro gerado: {os.path.getsize(path) / 1e6:.1f} MB")
+        for mode in args.modes:
+            count, elapsed, peak = measure(mode, path)
+            unit = "statements" if mode.startswith('parse') else "tokens"
+            print(f"{mode:>10}: {count} {unit}, {elapsed:.1f} s, pico de RSS {peak:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Código corrido num interpretador novo: do import do lexer até ao primeiro
+# token, e do import do compilador até ao fim do primeiro parse
+STAGES = {
+    'primeiro token': ("import time\n"
+                       "start = time.perf_counter()\n"
+                       "from lexer import get_lexer\n"
+                       "local_lexer = get_lexer().clone()\n"
+                       "local_lexer.input('program Bench; begin end.')\n"
+                       "local_lexer.token()\n"
+                       "print(time.perf_counter() - start)\n"),
+    'primeiro parse': ("import time\n"
+                       "start = time.perf_counter()\n"
+                       "from compiler import parse\n"
+                       "parse('program Bench; begin end.')\n"
+                       "print(time.perf_counter() - start)\n"),
+}
+
+
+# Tempos (segundos) de uma fase em repeat interpretadores novos, a correr na diretoria do pacote
+def stage_times(code, repeat):
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', code], cwd=PACKAGE_DIR, capture_output=True, text=True,
+                                check=True)
+        times.append(float(result.stdout.split()[-1]))
+    return times
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tempo de arranque: do import até ao primeiro token e ao primeiro parse")
+    arg_parser.add_argument("--repeat", type=int, default=10, help="número de interpretadores lançados por fase")
+    arg_parser.add_argument("--max-ms", type=float,
+                            help="termina com erro se a mediana até ao primeiro token passar deste limite")
+    args = arg_parser.parse_args(argv)
+
+    medians = {}
+    for stage, code in STAGES.items():
+        times = stage_times(code, args.repeat)
+        medians[stage] = statistics.median(times)
+        print(f"{stage:>15}: mediana {medians[stage] * 1000:.1f} ms, mínimo {min(times) * 1000:.1f} ms")
+
+    if args.max_ms is not None and medians['primeiro token'] * 1000 > args.max_ms:
+        print(f"Arranque acima do limite de {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
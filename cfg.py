@@ -0,0 +1,218 @@
+# Grafo de fluxo de controlo (CFG) em blocos básicos sobre o código VM,
+# com as instruções como pares (Op, operando) de instructions.py
+
+from instructions import Op
+
+# Instruções que terminam um bloco básico
+JUMPS = (Op.JUMP, Op.JZ)
+EXITS = (Op.STOP, Op.RETURN, Op.ERR)
+
+
+def is_label(instruction):
+    return instruction[0] == Op.LABEL
+
+
+# Bloco básico: rótulos de entrada e instruções sem saltos para o meio.
+# Só a última instrução pode ser um salto, STOP, RETURN ou ERR
+class BasicBlock:
+    __slots__ = ('labels', 'instructions')
+
+    def __init__(self, labels=None, instructions=None):
+        self.labels = labels if labels is not None else []
+        self.instructions = instructions if instructions is not None else []
+
+    # Último salto do bloco como (nome, rótulo) ou None
+    def jump(self):
+        if self.instructions:
+            name, operand = self.instructions[-1]
+            if name in JUMPS:
+                return name, operand
+        return None
+
+    # O bloco continua no seguinte quando não acaba em JUMP, STOP, RETURN ou ERR
+    def falls_through(self):
+        return not self.instructions or self.instructions[-1][0] not in (Op.JUMP,) + EXITS
+
+    def __repr__(self):
+        return f"BasicBlock({self.labels!r}, {self.instructions!r})"
+
+
+# CFG de um programa: blocos pela ordem em que aparecem no código, com as
+# arestas calculadas a partir dos saltos e da passagem para o bloco seguinte.
+# As entradas são o primeiro bloco e os blocos referidos por PUSHA (procedimentos)
+class ControlFlowGraph:
+    def __init__(self, blocks):
+        self.blocks = blocks
+
+    @classmethod
+    def from_code(cls, code):
+        blocks = [BasicBlock()]
+        for instruction in code:
+            current = blocks[-1]
+            if is_label(instruction):
+                # Cada rótulo começa um bloco; rótulos seguidos dão blocos vazios
+                if current.instructions or current.labels:
+                    current = BasicBlock()
+                    blocks.append(current)
+                current.labels.append(instruction[1])
+                continue
+            current.instructions.append(instruction)
+            name = instruction[0]
+            if name in JUMPS or name in EXITS:
+                blocks.append(BasicBlock())
+        if len(blocks) > 1 and not blocks[-1].labels and not blocks[-1].instructions:
+            blocks.pop()
+        return cls(blocks)
+
+    def to_code(self):
+        code = []
+        for block in self.blocks:
+            code.extend((Op.LABEL, label) for label in block.labels)
+            code.extend(block.instructions)
+        return code
+
+    # Tabela rótulo -> bloco
+    def label_table(self):
+        return {label: block for block in self.blocks for label in block.labels}
+
+    # Rótulos usados como operando de JUMP, JZ ou PUSHA
+    def referenced_labels(self):
+        labels = set()
+        for block in self.blocks:
+            for name, operand in block.instructions:
+                if name in JUMPS or name == Op.PUSHA:
+                    labels.add(operand)
+        return labels
+
+    # Sucessores de cada bloco (pela posição na lista de blocos)
+    def successors(self):
+        labels = self.label_table()
+        position = {id(block): i for i, block in enumerate(self.blocks)}
+        edges = []
+        for i, block in enumerate(self.blocks):
+            targets = []
+            jump = block.jump()
+            if jump is not None and jump[1] in labels:
+                targets.append(position[id(labels[jump[1]])])
+            if block.falls_through() and i + 1 < len(self.blocks):
+                targets.append(i + 1)
+            edges.append(targets)
+        return edges
+
+    # Blocos alcançáveis a partir das entradas
+    def reachable(self):
+        labels = self.label_table()
+        position = {id(block): i for i, block in enumerate(self.blocks)}
+        edges = self.successors()
+        pending = [0] if self.blocks else []
+        for block in self.blocks:
+            for name, operand in block.instructions:
+                if name == Op.PUSHA and operand in labels:
+                    pending.append(position[id(labels[operand])])
+        seen = set()
+        while pending:
+            i = pending.pop()
+            if i not in seen:
+                seen.add(i)
+                pending.extend(edges[i])
+        return seen
+
+    # Destino final de um salto para label: atravessa blocos vazios e blocos
+    # que só contêm JUMP. Devolve o rótulo final e o bloco (ou None se sair do código)
+    def resolve(self, label, labels):
+        seen = set()
+        while label in labels and label not in seen:
+            seen.add(label)
+            block = labels[label]
+            if not block.instructions:
+                i = self.blocks.index(block)
+                if i + 1 >= len(self.blocks) or not self.blocks[i + 1].labels:
+                    break
+                label = self.blocks[i + 1].labels[0]
+            elif len(block.instructions) == 1 and block.instructions[0][0] == Op.JUMP:
+                label = block.instructions[0][1]
+            else:
+                break
+        return label, labels.get(label)
+
+    # Threading de saltos: um salto para um bloco vazio ou para outro JUMP passa
+    # a saltar diretamente para o destino final; um JUMP para um bloco que só
+    # tem STOP ou RETURN é substituído por essa instrução
+    def thread_jumps(self):
+        labels = self.label_table()
+        threaded = 0
+        for block in self.blocks:
+            jump = block.jump()
+            if jump is None:
+                continue
+            name, target = jump
+            final, final_block = self.resolve(target, labels)
+            if name == Op.JUMP and final_block is not None and len(final_block.instructions) == 1 \
+                    and final_block.instructions[0][0] in (Op.STOP, Op.RETURN):
+                block.instructions[-1] = final_block.instructions[0]
+                threaded += 1
+            elif final != target:
+                block.instructions[-1] = (name, final)
+                threaded += 1
+        return threaded
+
+    # Junta cada bloco vazio (só rótulos) ao bloco seguinte e faz os saltos
+    # usarem o primeiro rótulo do bloco resultante
+    def merge_empty_blocks(self):
+        merged = 0
+        blocks = []
+        carried = []
+        for block in self.blocks:
+            if not block.instructions and block is not self.blocks[-1]:
+                carried.extend(block.labels)
+                merged += 1
+                continue
+            block.labels = carried + block.labels
+            carried = []
+            blocks.append(block)
+        self.blocks = blocks
+
+        renamed = {}
+        for block in self.blocks:
+            for label in block.labels[1:]:
+                renamed[label] = block.labels[0]
+        if renamed:
+            for block in self.blocks:
+                for i, (name, operand) in enumerate(block.instructions):
+                    if (name in JUMPS or name == Op.PUSHA) and operand in renamed:
+                        block.instructions[i] = (name, renamed[operand])
+        return merged
+
+    # Remove os blocos que nenhuma entrada alcança; devolve (blocos removidos, instruções removidas)
+    def remove_unreachable(self):
+        reachable = self.reachable()
+        dead = [block for i, block in enumerate(self.blocks) if i not in reachable]
+        self.blocks = [block for i, block in enumerate(self.blocks) if i in reachable]
+        return len(dead), sum(len(block.instructions) for block in dead)
+
+    # Remove os rótulos que nenhuma instrução refere; devolve quantos foram removidos
+    def remove_unused_labels(self):
+        referenced = self.referenced_labels()
+        removed = 0
+        for block in self.blocks:
+            kept = [label for label in block.labels if label in referenced]
+            removed += len(block.labels) - len(kept)
+            block.labels = kept
+        return removed
+
+
+# Otimizações sobre o CFG. Devolve o código novo e, para cada passagem,
+# (vezes que foi aplicada, instruções removidas), como a passagem peephole
+def optimize_cfg(code):
+    graph = ControlFlowGraph.from_code(code)
+    threaded = graph.thread_jumps()
+    merged = graph.merge_empty_blocks()
+    dead_blocks, dead_instructions = graph.remove_unreachable()
+    labels = graph.remove_unused_labels()
+    stats = {
+        'jump_threading': (threaded, 0),
+        'empty_blocks': (merged, 0),
+        'unreachable_blocks': (dead_blocks, dead_instructions),
+        'unused_labels': (labels, 0),
+    }
+    return graph.to_code(), stats
@@ -0,0 +1,1212 @@
+import argparse
+import copy
+import functools
+import sys
+
+from cfg import optimize_cfg
+from lexer import get_lexer, tokenize_file
+from nodes import (EXPRESSIONS, STATEMENTS, ArrayElement, ArrayType, BinOp, Case, Compound, For, FunctionCall, If, Number,
+                   String, Temporary, Variable, While, dispatch_table)
+from instructions import OPERAND_KINDS, InstructionBuffer, Op
+from optimizer import ValueNumbering, fold_statement, peephole, statement_names
+from parser import get_parser
+
+# Versão do compilador (faz parte da chave da cache da compilação em lote)
+COMPILER_VERSION = "1.0"
+
+# Tamanho máximo (em instruções) do corpo de um procedimento para ser expandido inline com -O
+INLINE_THRESHOLD = 20
+
+# Os arrays com mais elementos do que este limite ficam num bloco da heap da
+# VM (ALLOC), com o endereço do bloco numa única variável global
+HEAP_THRESHOLD = 1024
+
+# Escolha da estratégia do case: até CASE_LINEAR_LIMIT intervalos de rótulos
+# testa-se um a um; acima disso usa-se uma tabela de saltos se os rótulos
+# cobrirem pelo menos CASE_TABLE_DENSITY dos valores entre o menor e o maior
+# (e a tabela não passar de CASE_TABLE_MAX entradas), senão pesquisa binária
+CASE_LINEAR_LIMIT = 3
+CASE_TABLE_DENSITY = 0.5
+CASE_TABLE_MAX = 1024
+
+# Formatos do ficheiro de saída: texto EWVM com rótulos, texto pré-ligado (os
+# saltos com o índice da instrução de destino) e bytecode binário para vm.py
+OUTPUT_FORMATS = ('ewvm', 'linked', 'bytecode')
+
+
+# Resultado de uma compilação: código VM e tabelas usadas para o gerar
+class CompiledProgram:
+    def __init__(self, name, vm_code, symbol_table, procedure_table, optimization_stats=None):
+        self.name = name
+        self.vm_code = vm_code
+        self.symbol_table = symbol_table
+        self.procedure_table = procedure_table
+        # Para cada passagem do CFG e regra peephole: (vezes aplicada, instruções removidas)
+        self.optimization_stats = optimization_stats or {}
+        self.linked = None
+
+    # O texto é gerado uma vez a partir do buffer e escrito de uma só vez
+    def text(self):
+        return self.vm_code.text()
+
+    # Código ligado (vm.Program), calculado uma vez e partilhado pelos formatos pré-ligados
+    def link(self):
+        if self.linked is None:
+            self.linked = self.vm_code.link()
+        return self.linked
+
+    # Conteúdo do ficheiro de saída num dos OUTPUT_FORMATS
+    def output(self, output_format='ewvm'):
+        if output_format == 'bytecode':
+            return self.link().to_bytes()
+        if output_format == 'linked':
+            return self.link().text().encode('utf-8')
+        return self.text().encode('utf-8')
+
+    def write(self, path, output_format='ewvm'):
+        data = self.output(output_format)
+        with open(path, "wb") as out_file:
+            out_file.write(data)
+
+
+# Função para fazer o parsing de um programa sem partilhar estado entre chamadas.
+# Com path, os tokens são lidos do ficheiro em streaming em vez de um texto em memória
+def parse(source=None, path=None):
+    # Cada parse usa o seu próprio lexer e a sua própria cópia do parser,
+    # para que várias compilações possam correr em threads diferentes
+    local_lexer = get_lexer().clone()
+    local_lexer.syntax_errors = []
+    if path is None:
+        ast = copy.copy(get_parser()).parse(source, lexer=local_lexer)
+    else:
+        tokens = tokenize_file(path, local_lexer)
+        ast = copy.copy(get_parser()).parse(lexer=local_lexer, tokenfunc=functools.partial(next, tokens, None))
+    if ast is None or local_lexer.syntax_errors:
+        raise SyntaxError("Programa com erros de sintaxe")
+    return ast
+
+
+# Compilador: guarda todo o estado de uma compilação
+class Compiler:
+    def __init__(self, optimize=False, inline_threshold=INLINE_THRESHOLD, bounds_check=False,
+                 heap_threshold=HEAP_THRESHOLD):
+        self.optimize = optimize
+        self.inline_threshold = inline_threshold
+        self.bounds_check = bounds_check  # Verificar os índices dos arrays em tempo de execução
+        self.heap_threshold = heap_threshold  # 0 deixa todos os arrays na pilha global
+        # Tabelas de despacho: classe do nó -> método process_<kind> que gera o seu código
+        self.statement_handlers = dispatch_table(self, 'process_', STATEMENTS)
+        self.expression_handlers = dispatch_table(self, 'process_', EXPRESSIONS)
+        self.reset()
+
+    def reset(self):
+        # código VM: os buffers dos procedimentos e os temporários partilham a
+        # tabela de constantes do programa
+        self.vm_code = InstructionBuffer()
+
+        # Tabela de símbolos para mapear variáveis para endereços
+        self.symbol_table = {}
+        self.next_address = 0  # Próximo endereço disponível na memória
+        self.label_counter = 0  # Contador para gerar rótulos únicos
+
+        # Tabela de procedimentos para armazenar informações sobre procedures
+        self.procedure_table = {}
+        self.calls = set()  # Procedimentos chamados pelo corpo que está a ser gerado
+        self.current_procedure = None  # Procedimento que está a ser gerado (None no programa principal)
+
+        # Variáveis locais e parâmetros do procedimento que está a ser gerado
+        # (None no programa principal)
+        self.local_table = None
+
+        # Temporários (limites dos for, seletores dos case) do corpo que está a
+        # ser gerado: globais no programa principal, no frame nos procedimentos
+        self.temp_scope = 'global'
+        self.temp_base = 0  # Primeiro endereço dos temporários desse corpo
+        self.temp_depth = 0  # Temporários vivos nesse corpo
+
+        # Tabelas de saltos dos case (rótulos por entrada). Ocupam endereços
+        # globais depois dos temporários e são preenchidas no início do
+        # programa, na posição prologue_index do código
+        self.tables = []
+        self.prologue_index = 0
+
+        # Saídas de erro das verificações de limites: (rótulo, mensagem),
+        # colocadas no fim do programa
+        self.bounds_errors = []
+
+    # Função para adicionar instruções ao código VM
+    def emit(self, opcode, operand=None):
+        self.vm_code.emit(opcode, operand)
+
+    # Buffer vazio com a tabela de constantes do programa
+    def new_buffer(self):
+        return InstructionBuffer(self.vm_code.constants)
+
+    # Função para gerar rótulos únicos
+    def new_label(self, prefix):
+        label = f"{prefix}{self.label_counter}"
+        self.label_counter += 1
+        return label
+
+    # Compila o texto de um programa
+    def compile(self, source):
+        return self.compile_ast(parse(source))
+
+    # Compila um ficheiro, lendo os tokens em streaming
+    def compile_file(self, path):
+        return self.compile_ast(parse(path=path))
+
+    def compile_ast(self, ast):
+        self.reset()
+        self.process_program(ast)
+        optimization_stats = None
+        if self.optimize:
+            code, cfg_stats = optimize_cfg(list(self.vm_code))
+            code, peephole_stats = peephole(code)
+            self.vm_code = InstructionBuffer.from_instructions(code, self.vm_code.constants)
+            optimization_stats = {**cfg_stats, **peephole_stats}
+        return CompiledProgram(ast.name, self.vm_code, self.symbol_table, self.procedure_table, optimization_stats)
+
+    # Dobragem de constantes (só com otimizações), feita depois de as
+    # declarações estarem na tabela de símbolos para conhecer os tipos
+    def fold(self, stmt):
+        if not self.optimize:
+            return stmt
+        return fold_statement(stmt, self.get_expression_type, self.call_effects)
+
+    # Programa principal
+    def process_program(self, program):
+        block = program.block
+        self.process_declarations(block.declarations)
+        for proc in block.procedures:
+            self.declare_procedure(proc)
+        self.propagate_writes()
+        body = self.fold(Compound(block.statements, lineno=block.lineno))
+        self.layout_temporaries(body)
+        self.prologue_index = len(self.vm_code)
+        for proc in block.procedures:
+            self.process_procedure(proc)
+        self.process_statement(body)
+        self.emit(Op.STOP)
+        self.link()
+
+    # Declarações de variáveis globais
+    def process_declarations(self, declarations):
+        for declaration in declarations:
+            var_type = declaration.var_type
+            for var in declaration.names:
+                if var in self.symbol_table:
+                    continue
+                if isinstance(var_type, ArrayType):
+                    self.symbol_table[var] = self.declare_array(var_type)
+                else:
+                    self.symbol_table[var] = {
+                        'address': self.next_address,
+                        'type': var_type,
+                        'scope': 'global'
+                    }
+                    self.emit(Op.PUSHN, 1)
+                    self.next_address += 1
+
+    # Reserva a memória global de um array (também dos arrays locais) e devolve a sua entrada
+    def declare_array(self, var_type):
+        dimensions, element_type, size = array_layout(var_type)
+        # Na heap, 'address' é a global com o endereço do bloco e
+        # 'offset' é relativo ao início do bloco
+        on_heap = 0 < self.heap_threshold < size
+        base = 0 if on_heap else self.next_address
+        offset = base - sum(lower * stride for lower, _, stride in dimensions)
+        if on_heap and -size <= offset < 0:
+            # O bloco começa no elemento com os índices a 0 (como
+            # se lower fosse 0), para a parte constante do endereço
+            # caber sempre no operando de LOAD/STORE
+            size -= offset
+            offset = 0
+        entry = {
+            'address': self.next_address,
+            'type': 'array',
+            'scope': 'global',
+            'storage': 'heap' if on_heap else 'global',
+            'lower': var_type.lower,
+            'upper': var_type.upper,
+            'element_type': element_type,
+            # (lower, upper, stride) de cada dimensão e endereço do
+            # elemento com todos os índices a 0, calculados uma vez
+            'dimensions': dimensions,
+            'offset': offset
+        }
+        if on_heap:
+            self.emit(Op.ALLOC, size)  # Deixa o endereço do bloco na global do array
+            self.next_address += 1
+        else:
+            self.emit(Op.PUSHN, size)
+            self.next_address += size
+        return entry
+
+    # Fase de layout dos temporários do programa principal: tantos endereços
+    # globais quantos os for aninhados mais fundo (os for irmãos reutilizam os
+    # mesmos endereços), a seguir às variáveis e reservados de uma só vez.
+    # Os temporários dos procedimentos ficam no frame de cada chamada
+    def layout_temporaries(self, body):
+        size = max_temporaries(body)
+        self.temp_base = self.next_address
+        self.next_address += size
+        if size:
+            self.emit(Op.PUSHN, size)
+
+    # Entrada de um procedimento ou função na tabela de procedimentos. O frame
+    # de uma chamada tem, relativamente a FP: o resultado (funções) e os
+    # parâmetros por baixo (empilhados por quem chama), e as variáveis locais e
+    # os temporários a partir de 0. Os arrays locais ficam em memória global
+    def declare_procedure(self, proc):
+        if proc.name in self.procedure_table:
+            raise SyntaxError(f"Procedimento '{proc.name}' declarado duas vezes, linha {proc.lineno}")
+        params = [(name, declaration.var_type) for declaration in proc.params for name in declaration.names]
+        if any(isinstance(var_type, ArrayType) for _, var_type in params) or isinstance(proc.return_type, ArrayType):
+            raise SyntaxError(f"Parâmetros e resultados do tipo array não são suportados, linha {proc.lineno}")
+
+        local_table = {}
+        for i, (name, var_type) in enumerate(params):
+            local_table[name] = {'address': i - len(params), 'type': var_type, 'scope': 'local'}
+        if proc.return_type is not None:
+            # Dentro da função, o nome da função é a variável do resultado
+            local_table[proc.name] = {'address': -len(params) - 1, 'type': proc.return_type, 'scope': 'local'}
+        frame_size = 0
+        for declaration in proc.block.declarations:
+            for name in declaration.names:
+                if name in local_table:
+                    continue
+                if isinstance(declaration.var_type, ArrayType):
+                    local_table[name] = self.declare_array(declaration.var_type)
+                else:
+                    local_table[name] = {'address': frame_size, 'type': declaration.var_type, 'scope': 'local'}
+                    frame_size += 1
+
+        written, referenced = statement_names(Compound(proc.block.statements))
+        self.procedure_table[proc.name] = {
+            'label': self.new_label(f"proc{proc.name}"),
+            'params': [var_type for _, var_type in params],
+            'return_type': proc.return_type,
+            'locals': local_table,
+            'frame_size': frame_size,  # Posições do frame reservadas à entrada (locais e temporários)
+            'body': None,
+            'code': self.new_buffer(),  # Código do procedimento, colocado no programa pelo linker
+            'calls': set(),  # Procedimentos chamados no corpo (arestas do grafo de chamadas)
+            'writes': {name for name in written if name not in local_table},  # Globais escritos (LICM)
+            'references': referenced - local_table.keys()  # Possíveis chamadas, vistas na AST
+        }
+
+    # Os globais escritos por um procedimento incluem os escritos pelos
+    # procedimentos e funções que chama, até não mudarem
+    def propagate_writes(self):
+        changed = True
+        while changed:
+            changed = False
+            for entry in self.procedure_table.values():
+                for name in entry['references']:
+                    callee = self.procedure_table.get(name)
+                    if callee is not None and not callee['writes'] <= entry['writes']:
+                        entry['writes'] |= callee['writes']
+                        changed = True
+
+    # Nomes globais escritos por uma chamada a name, ou None se name não for
+    # um procedimento ou uma função
+    def call_effects(self, name):
+        entry = self.procedure_table.get(name)
+        return None if entry is None else entry['writes']
+
+    # Código de um procedimento: reserva o frame à entrada e liberta-o antes do RETURN
+    def process_procedure(self, proc):
+        entry = self.procedure_table[proc.name]
+
+        # Gerar o código do procedimento à parte do programa principal
+        saved = (self.vm_code, self.calls, self.local_table, self.temp_scope, self.temp_base)
+        self.vm_code, self.calls = entry['code'], entry['calls']
+        self.local_table = entry['locals']
+        self.current_procedure = proc.name
+        body = self.fold(Compound(proc.block.statements, lineno=proc.block.lineno))
+        entry['body'] = body
+
+        self.temp_scope = 'local'
+        self.temp_base = entry['frame_size']
+        entry['frame_size'] += max_temporaries(body)
+        frame_size = entry['frame_size']
+
+        self.emit(Op.LABEL, entry['label'])
+        if frame_size:
+            self.emit(Op.PUSHN, frame_size)
+        self.process_statement(body)
+        if frame_size:
+            self.emit(Op.POP, frame_size)
+        self.emit(Op.RETURN)
+
+        self.vm_code, self.calls, self.local_table, self.temp_scope, self.temp_base = saved
+        self.current_procedure = None
+
+    # Linker: coloca depois do STOP o código dos procedimentos alcançáveis a
+    # partir do programa principal no grafo de chamadas, pela ordem de declaração.
+    # Os procedimentos que nunca são chamados não entram no programa
+    def link(self):
+        reachable = set()
+        pending = list(self.calls)
+        while pending:
+            proc_name = pending.pop()
+            if proc_name not in reachable:
+                reachable.add(proc_name)
+                pending.extend(self.procedure_table[proc_name]['calls'])
+        for proc_name, entry in self.procedure_table.items():
+            if proc_name in reachable:
+                # Os arrays locais não estão no frame, por isso não podem ser recursivos
+                if self.is_recursive(proc_name) and any(local['scope'] == 'global' for local in entry['locals'].values()):
+                    raise SyntaxError(f"Procedimento recursivo '{proc_name}' com arrays locais não é suportado")
+                self.vm_code.extend(entry['code'])
+
+        prologue = self.new_buffer()
+        for labels in self.tables:
+            for label in labels:
+                prologue.emit(Op.PUSHA, label)
+        self.vm_code.insert(self.prologue_index, prologue)
+
+        for label, message in self.bounds_errors:
+            self.emit(Op.LABEL, label)
+            self.emit(Op.ERR, message)
+
+    # Um procedimento é recursivo se se alcança a si próprio no grafo de chamadas
+    def is_recursive(self, proc_name):
+        seen = set()
+        pending = list(self.procedure_table[proc_name]['calls'])
+        while pending:
+            callee = pending.pop()
+            if callee == proc_name:
+                return True
+            if callee not in seen:
+                seen.add(callee)
+                pending.extend(self.procedure_table[callee]['calls'])
+        return False
+
+    # Só se expandem inline (com -O) procedimentos já gerados, não recursivos,
+    # sem parâmetros nem frame (o corpo usaria o FP de quem chama) e com o
+    # corpo dentro do limite de tamanho
+    def can_inline(self, proc_name):
+        if not self.optimize or proc_name == self.current_procedure:
+            return False
+        entry = self.procedure_table[proc_name]
+        if not entry['code'] or entry['params'] or entry['return_type'] is not None or entry['frame_size']:
+            return False
+        body = list(entry['code'])[1:-1]
+        size = sum(1 for opcode, _ in body if opcode != Op.LABEL)
+        return size <= self.inline_threshold and not self.is_recursive(proc_name)
+
+    # Copia o corpo de um procedimento (sem o rótulo de entrada e o RETURN) para o
+    # ponto de chamada, com rótulos novos para continuarem únicos
+    def inline_procedure(self, proc_name):
+        entry = self.procedure_table[proc_name]
+        body = list(entry['code'])[1:-1]
+        renamed = {}
+        for opcode, operand in body:
+            if opcode == Op.LABEL:
+                renamed[operand] = self.new_label(f"{operand}_")
+        for opcode, operand in body:
+            if OPERAND_KINDS[opcode] == 'label':
+                operand = renamed.get(operand, operand)
+            self.emit(opcode, operand)
+        # As chamadas feitas pelo corpo passam a ser feitas por quem o expandiu
+        self.calls.update(entry['calls'])
+
+    # Entrada de um nome visível no corpo que está a ser gerado: primeiro as
+    # variáveis locais e parâmetros do procedimento, depois as globais
+    def lookup(self, var_name):
+        if self.local_table is not None and var_name in self.local_table:
+            return self.local_table[var_name]
+        return self.symbol_table.get(var_name)
+
+    # Função para obter a entrada de uma variável simples na tabela de símbolos
+    def variable_entry(self, var_name, lineno):
+        entry = self.lookup(var_name)
+        if entry is None:
+            raise SyntaxError(f"Variável '{var_name}' não declarada, linha {lineno}")
+        return entry
+
+    # Função para obter a entrada de um array na tabela de símbolos
+    def array_entry(self, var_name, lineno):
+        entry = self.lookup(var_name)
+        if entry is None:
+            raise SyntaxError(f"Array '{var_name}' não declarado, linha {lineno}")
+        if entry.get('type') != 'array':
+            raise SyntaxError(f"'{var_name}' não é um array, linha {lineno}")
+        return entry
+
+    # Leitura e escrita de uma posição global ou do frame (relativa a FP)
+    def emit_load(self, scope, address):
+        self.emit(Op.PUSHL if scope == 'local' else Op.PUSHG, address)
+
+    def emit_store(self, scope, address):
+        self.emit(Op.STOREL if scope == 'local' else Op.STOREG, address)
+
+    # Um nome que não é variável mas é uma função sem argumentos é uma chamada
+    def is_function_name(self, var_name):
+        entry = self.procedure_table.get(var_name)
+        return self.lookup(var_name) is None and entry is not None and entry['return_type'] is not None
+
+    # Tipo de uma variável, de um elemento de array ou do resultado de uma
+    # função (as constantes já sabem o seu tipo)
+    def leaf_type(self, expr):
+        if isinstance(expr, FunctionCall) or self.is_function_name(expr.name):
+            proc = self.procedure_table.get(expr.name)
+            return proc['return_type'] if proc is not None and proc['return_type'] is not None else 'unknown'
+        if isinstance(expr, ArrayElement):
+            return self.array_entry(expr.name, expr.lineno)['element_type']
+        entry = self.lookup(expr.name)
+        if entry is None:
+            return 'unknown'
+        return entry['type']
+
+    # Função para determinar o tipo de uma expressão. O tipo fica guardado no
+    # próprio nó, por isso cada nó é tipado uma única vez
+    def get_expression_type(self, expr):
+        expr_type = expr.type
+        if expr_type is None:
+            if isinstance(expr, BinOp):
+                self.annotate_expression(expr)
+            else:
+                expr.type = self.leaf_type(expr)
+            expr_type = expr.type
+        return expr_type
+
+    # Calcula o tipo de todos os nós ainda sem tipo de uma expressão, dos filhos
+    # para o pai, com uma pilha explícita para suportar expressões muito longas
+    def annotate_expression(self, expr):
+        stack = [expr]
+        while stack:
+            node = stack[-1]
+            if node.type is not None:
+                stack.pop()
+                continue
+            if not isinstance(node, BinOp):
+                self.get_expression_type(node)
+                stack.pop()
+                continue
+            pending = [child for child in (node.left, node.right) if child.type is None]
+            if pending:
+                stack.extend(pending)
+                continue
+            op = node.op
+            left_type = node.left.type
+            right_type = node.right.type
+            if op in ['=', '<>', '<', '<=', '>', '>=', 'and', 'or']:
+                node.type = 'boolean'
+            elif op in ['/', '*', '+', '-'] and (left_type == 'real' or right_type == 'real'):
+                node.type = 'real'
+            else:
+                node.type = left_type
+            stack.pop()
+
+    # Função para processar expressões e gerar código na ordem correta
+    def process_expression(self, expr):
+        self.expression_handlers[type(expr)](expr)
+
+    def process_number(self, expr):
+        if isinstance(expr.value, float):
+            self.emit(Op.PUSHF, expr.value)
+        else:
+            self.emit(Op.PUSHI, expr.value)
+
+    def process_string(self, expr):
+        self.emit(Op.PUSHS, expr.value)
+
+    def process_temporary(self, expr):
+        self.emit_load(expr.scope, expr.address)
+
+    def process_variable(self, expr):
+        if self.is_function_name(expr.name):
+            self.emit_call(expr.name, [], expr.lineno)
+            return
+        var_info = self.variable_entry(expr.name, expr.lineno)
+        self.emit_load(var_info['scope'], var_info['address'])
+
+    def process_function_call(self, expr):
+        entry = self.procedure_table.get(expr.name)
+        if entry is None or entry['return_type'] is None:
+            raise SyntaxError(f"Função '{expr.name}' não declarada, linha {expr.lineno}")
+        self.emit_call(expr.name, expr.args, expr.lineno)
+
+    # Chamada: o lugar do resultado (funções) e os argumentos, por valor e pela
+    # ordem dos parâmetros, ficam por baixo do frame do chamado; depois do
+    # RETURN quem chama retira os argumentos e fica com o resultado no topo
+    def emit_call(self, proc_name, args, lineno):
+        entry = self.procedure_table[proc_name]
+        if len(args) != len(entry['params']):
+            raise SyntaxError(f"'{proc_name}' espera {len(entry['params'])} argumentos, linha {lineno}")
+        if entry['return_type'] is not None:
+            self.emit(Op.PUSHI, 0)
+        for arg in args:
+            self.process_expression(arg)
+        self.calls.add(proc_name)
+        self.emit(Op.PUSHA, entry['label'])
+        self.emit(Op.CALL)
+        if args:
+            self.emit(Op.POP, len(args))
+
+    # Endereço de um elemento de array: offset + soma(índice * stride), com
+    # offset = base - soma(lower * stride) calculado na declaração. Devolve as
+    # instruções (opcode, operando) que leem e escrevem o elemento depois do
+    # código gerado aqui:
+    #  - global, índices constantes: PUSHG/STOREG do endereço, sem código;
+    #  - global: LOADN/STOREN com o endereço calculado no topo da pilha;
+    #  - heap: LOAD/STORE com o endereço do bloco (mais a parte variável, somada
+    #    com PADD) no topo e a parte constante como operando
+    def process_element_address(self, expr):
+        emit = self.emit
+        entry = self.array_entry(expr.name, expr.lineno)
+        if entry['storage'] == 'heap':
+            emit(Op.PUSHG, entry['address'])
+            constant, variable = self.process_index_offset(expr, entry)
+            if variable:
+                if constant < 0:
+                    emit(Op.PUSHI, constant)
+                    emit(Op.ADD)
+                    constant = 0
+                emit(Op.PADD)
+            return (Op.LOAD, constant), (Op.STORE, constant)
+        constant, variable = self.process_index_offset(expr, entry)
+        if not variable:
+            return (Op.PUSHG, constant), (Op.STOREG, constant)
+        if constant:
+            emit(Op.PUSHI, constant)
+            emit(Op.ADD)
+        return (Op.LOADN, None), (Op.STOREN, None)
+
+    # Gera a soma das partes variáveis de soma(índice * stride) e devolve
+    # (parte constante, se houve parte variável). Os índices constantes, e a
+    # constante de i + c ou i - c, são somados em compilação ao offset
+    def process_index_offset(self, expr, entry):
+        emit = self.emit
+        dimensions = entry['dimensions']
+        if len(expr.indices) != len(dimensions):
+            raise SyntaxError(f"'{expr.name}' tem {len(dimensions)} dimensões, linha {expr.lineno}")
+
+        constant = entry['offset']
+        variable = False
+        for index, (lower, upper, stride) in zip(expr.indices, dimensions):
+            if isinstance(index, Number) and isinstance(index.value, int):
+                if not lower <= index.value <= upper:
+                    raise SyntaxError(f"Índice {index.value} fora dos limites de '{expr.name}', linha {expr.lineno}")
+                constant += index.value * stride
+                continue
+            # Com verificação de limites é preciso o valor completo do índice
+            if self.bounds_check:
+                self.process_expression(index)
+                self.emit_bounds_check(expr, lower, upper)
+            else:
+                index, shift = split_constant(index)
+                constant += shift * stride
+                self.process_expression(index)
+            if stride != 1:
+                emit(Op.PUSHI, stride)
+                emit(Op.MUL)
+            if variable:
+                emit(Op.ADD)
+            variable = True
+        return constant, variable
+
+    # Verificação de limites do índice no topo da pilha: salta para uma saída
+    # de erro (ERR) se estiver fora de [lower, upper]
+    def emit_bounds_check(self, expr, lower, upper):
+        emit = self.emit
+        error_label = self.new_label("boundserror")
+        self.bounds_errors.append((error_label, f"Índice fora dos limites de '{expr.name}', linha {expr.lineno}"))
+        emit(Op.DUP, 1)
+        emit(Op.PUSHI, lower)
+        emit(Op.SUPEQ)
+        emit(Op.JZ, error_label)
+        emit(Op.DUP, 1)
+        emit(Op.PUSHI, upper)
+        emit(Op.INFEQ)
+        emit(Op.JZ, error_label)
+
+    def process_array_element(self, expr):
+        load, _ = self.process_element_address(expr)
+        self.emit(*load)
+
+    def process_binop(self, expr):
+        # Cadeias associadas à esquerda (a + b + c + ...) são percorridas
+        # sem recursão: primeiro o operando mais à esquerda, depois cada
+        # operando direito seguido da sua operação
+        chain = []
+        while isinstance(expr, BinOp):
+            chain.append(expr)
+            expr = expr.left
+        self.process_expression(expr)
+        for node in reversed(chain):
+            self.process_expression(node.right)
+            self.emit_binop(node)
+
+    # Gera a instrução de uma binop cujos operandos já estão na pilha
+    def emit_binop(self, expr):
+        emit = self.emit
+        op = expr.op
+        left_type = self.get_expression_type(expr.left)
+        right_type = self.get_expression_type(expr.right)
+        using_real = (left_type == 'real' or right_type == 'real')
+
+        if op == '+':
+            emit(Op.FADD if using_real else Op.ADD)
+        elif op == '-':
+            emit(Op.FSUB if using_real else Op.SUB)
+        elif op == '*':
+            emit(Op.FMUL if using_real else Op.MUL)
+        elif op == '/':
+            emit(Op.FDIV if using_real else Op.DIV)
+        elif op == 'div':
+            emit(Op.DIV)
+        elif op == 'mod':
+            emit(Op.MOD)
+        elif op == '=':
+            emit(Op.EQUAL)
+        elif op == '<>':
+            emit(Op.EQUAL)
+            emit(Op.NOT)
+        elif op == '<':
+            emit(Op.FINF if using_real else Op.INF)
+        elif op == '<=':
+            emit(Op.FINFEQ if using_real else Op.INFEQ)
+        elif op == '>':
+            emit(Op.FSUP if using_real else Op.SUP)
+        elif op == '>=':
+            emit(Op.FSUPEQ if using_real else Op.SUPEQ)
+        elif op == 'and':
+            emit(Op.AND)
+        elif op == 'or':
+            emit(Op.OR)
+
+    # Função para processar statements na ordem correta
+    def process_statement(self, stmt):
+        if stmt is None:
+            return
+        self.statement_handlers[type(stmt)](stmt)
+
+    def process_assignment(self, stmt):
+        target = stmt.target
+        if isinstance(target, Temporary):
+            self.process_expression(stmt.expr)
+            self.emit_store(target.scope, target.address)
+            return
+        if isinstance(target, ArrayElement) and self.optimize and self.reuse_element_address(stmt):
+            return
+        # STORE (heap) espera o endereço debaixo do valor, por isso o endereço vem primeiro
+        if isinstance(target, ArrayElement) and self.array_entry(target.name, target.lineno)['storage'] == 'heap':
+            _, store = self.process_element_address(target)
+            self.process_expression(stmt.expr)
+            self.emit(*store)
+            return
+
+        # Processar a expressão primeiro
+        self.process_expression(stmt.expr)
+
+        # Armazenar o resultado
+        if isinstance(target, ArrayElement):
+            self.store_element(target)
+        else:
+            var_info = self.variable_entry(target.name, target.lineno)
+            self.emit_store(var_info['scope'], var_info['address'])
+
+    # a[i] := a[i] op ... (com -O): o endereço de a[i] é calculado uma vez e
+    # duplicado com DUP para a leitura, que é o primeiro operando avaliado.
+    # Devolve False (sem gerar código) se a atribuição não tiver esta forma
+    def reuse_element_address(self, stmt):
+        target = stmt.target
+        chain = []
+        expr = stmt.expr
+        while isinstance(expr, BinOp):
+            chain.append(expr)
+            expr = expr.left
+        if not chain or not isinstance(expr, ArrayElement):
+            return False
+        numbering = ValueNumbering(self.call_effects)
+        number = numbering.number(target)
+        if number is None or numbering.number(expr) != number:
+            return False
+        if all(isinstance(index, Number) for index in target.indices):
+            return False  # Endereço constante: PUSHG/STOREG diretos
+
+        # Com STOREN a reutilização custa DUP e SWAP: se o endereço se calcula
+        # em menos instruções, gera-se como sem -O (valor e depois endereço)
+        code = self.vm_code
+        self.vm_code = self.new_buffer()
+        load, store = self.process_element_address(target)
+        address_code, self.vm_code = self.vm_code, code
+        if store[0] == Op.STOREN and len(address_code) <= 2:
+            self.process_expression(stmt.expr)
+            self.vm_code.extend(address_code)
+            self.emit(*store)
+            return True
+
+        self.vm_code.extend(address_code)
+        self.emit(Op.DUP, 1)
+        self.emit(*load)
+        for node in reversed(chain):
+            self.process_expression(node.right)
+            self.emit_binop(node)
+        if store[0] == Op.STOREN:
+            self.emit(Op.SWAP)  # STOREN tira o endereço do topo e o valor de baixo
+        self.emit(*store)
+        return True
+
+    # Guarda o valor no topo da pilha num elemento de array
+    def store_element(self, target):
+        _, store = self.process_element_address(target)
+        if store[0] == Op.STORE:
+            self.emit(Op.SWAP)  # STORE tira o valor do topo e o endereço de baixo
+        self.emit(*store)
+
+    # Os argumentos constantes seguidos (strings e inteiros, já dobrados com
+    # -O) são juntos em compilação e escritos com um só PUSHS / WRITES
+    def process_writeln(self, stmt):
+        emit = self.emit
+        pending = []  # Texto constante ainda não escrito
+        for expr in stmt.args:
+            text = constant_text(expr)
+            if text is not None:
+                pending.append(text)
+                continue
+            self.emit_text("".join(pending))
+            pending = []
+
+            self.process_expression(expr)
+            expr_type = self.get_expression_type(expr)
+
+            if expr_type == 'integer' or expr_type == 'boolean':
+                emit(Op.WRITEI)
+            elif expr_type == 'real':
+                emit(Op.WRITEF)
+            elif expr_type == 'string':
+                emit(Op.WRITES)
+            else:
+                emit(Op.WRITEI)
+        self.emit_text("".join(pending))
+        emit(Op.WRITELN)
+
+    def emit_text(self, text):
+        if text:
+            self.emit(Op.PUSHS, text)
+            self.emit(Op.WRITES)
+
+    def process_readln(self, stmt):
+        emit = self.emit
+        target = stmt.target
+        emit(Op.READ)
+
+        if isinstance(target, ArrayElement):
+            emit(Op.ATOI)
+            self.store_element(target)
+        else:
+            var_info = self.variable_entry(target.name, target.lineno)
+            var_type = var_info['type']
+
+            if var_type == 'integer':
+                emit(Op.ATOI)
+            elif var_type == 'real':
+                emit(Op.ATOF)
+            elif var_type == 'boolean':
+                emit(Op.ATOI)
+
+            self.emit_store(var_info['scope'], var_info['address'])
+
+    def process_procedure_call(self, stmt):
+        if stmt.name not in self.procedure_table:
+            raise SyntaxError(f"Procedimento '{stmt.name}' não declarado, linha {stmt.lineno}")
+
+        if self.can_inline(stmt.name):
+            self.inline_procedure(stmt.name)
+            return
+
+        # Gerar chamada para o procedimento (o resultado de uma função é descartado)
+        self.emit_call(stmt.name, stmt.args, stmt.lineno)
+        if self.procedure_table[stmt.name]['return_type'] is not None:
+            self.emit(Op.POP, 1)
+
+    # Condições de if/while: código de saltos que vai para false_label quando a
+    # condição é falsa e continua na instrução seguinte quando é verdadeira.
+    # and/or são avaliados em curto-circuito; o valor booleano só é calculado
+    # quando é guardado ou escrito (process_expression)
+    def process_condition(self, expr, false_label):
+        if isinstance(expr, BinOp) and expr.op == 'and':
+            self.process_condition(expr.left, false_label)
+            self.process_condition(expr.right, false_label)
+        elif isinstance(expr, BinOp) and expr.op == 'or':
+            true_label = self.new_label("ortrue")
+            self.process_condition_true(expr.left, true_label)
+            self.process_condition(expr.right, false_label)
+            self.emit(Op.LABEL, true_label)
+        elif isinstance(expr, Number):
+            if expr.value == 0:
+                self.emit(Op.JUMP, false_label)
+        elif self.optimize and self.is_integer_difference(expr):
+            # a <> b é falso quando a - b é 0: SUB / JZ em vez de EQUAL / NOT / JZ
+            self.process_expression(expr.left)
+            self.process_expression(expr.right)
+            self.emit(Op.SUB)
+            self.emit(Op.JZ, false_label)
+        else:
+            self.process_expression(expr)
+            self.emit(Op.JZ, false_label)
+
+    # a <> b entre inteiros ou booleanos: o SUB da VM só serve para inteiros
+    # (com strings ou reais a comparação tem de ser EQUAL / NOT)
+    def is_integer_difference(self, expr):
+        return (isinstance(expr, BinOp) and expr.op == '<>'
+                and self.get_expression_type(expr.left) in ('integer', 'boolean')
+                and self.get_expression_type(expr.right) in ('integer', 'boolean'))
+
+    # O contrário de process_condition: salta para true_label quando a condição
+    # é verdadeira. Como a VM só tem JZ, as comparações são invertidas
+    def process_condition_true(self, expr, true_label):
+        if isinstance(expr, BinOp) and expr.op == 'or':
+            self.process_condition_true(expr.left, true_label)
+            self.process_condition_true(expr.right, true_label)
+        elif isinstance(expr, BinOp) and expr.op == 'and':
+            false_label = self.new_label("andfalse")
+            self.process_condition(expr.left, false_label)
+            self.process_condition_true(expr.right, true_label)
+            self.emit(Op.LABEL, false_label)
+        elif isinstance(expr, Number):
+            if expr.value != 0:
+                self.emit(Op.JUMP, true_label)
+        elif isinstance(expr, BinOp) and expr.op in INVERSE_COMPARISONS:
+            inverted = BinOp(INVERSE_COMPARISONS[expr.op], expr.left, expr.right, lineno=expr.lineno)
+            self.process_condition(inverted, true_label)
+        else:
+            self.process_expression(expr)
+            self.emit(Op.NOT)
+            self.emit(Op.JZ, true_label)
+
+    def process_if(self, stmt):
+        emit = self.emit
+
+        if stmt.else_stmt:
+            else_label = self.new_label("else")
+            end_label = self.new_label("endif")
+
+            # Processar condição
+            self.process_condition(stmt.condition, else_label)
+            self.process_statement(stmt.then_stmt)
+            emit(Op.JUMP, end_label)
+            emit(Op.LABEL, else_label)
+            self.process_statement(stmt.else_stmt)
+            emit(Op.LABEL, end_label)
+        else:
+            end_label = self.new_label("endif")
+            self.process_condition(stmt.condition, end_label)
+            self.process_statement(stmt.then_stmt)
+            emit(Op.LABEL, end_label)
+
+    def process_while(self, stmt):
+        emit = self.emit
+        start_label = self.new_label("while")
+        end_label = self.new_label("endwhile")
+
+        emit(Op.LABEL, start_label)
+        self.process_condition(stmt.condition, end_label)
+        self.process_statement(stmt.body)
+        emit(Op.JUMP, start_label)
+        emit(Op.LABEL, end_label)
+
+    def process_for(self, stmt):
+        emit = self.emit
+        var_info = self.variable_entry(stmt.var, stmt.lineno)
+        scope, var_addr = var_info['scope'], var_info['address']
+
+        # Gerar rótulos
+        start_label = self.new_label("for")
+        end_label = self.new_label("endfor")
+
+        # Processar valor inicial e armazenar na variável de controle
+        self.process_expression(stmt.start)
+        self.emit_store(scope, var_addr)
+
+        # Processar valor final e armazenar no temporário deste nível de for
+        limit_addr = self.temp_base + self.temp_depth
+        self.temp_depth += 1
+
+        self.process_expression(stmt.end)
+        self.emit_store(self.temp_scope, limit_addr)
+
+        # Início do loop
+        emit(Op.LABEL, start_label)
+
+        # Verificar condição baseada na direção
+        self.emit_load(scope, var_addr)                # valor da variável de controle
+        self.emit_load(self.temp_scope, limit_addr)  # valor limite
+
+        if stmt.direction == 'to':
+            emit(Op.INFEQ)
+            emit(Op.JZ, end_label)
+        else:  # downto
+            emit(Op.SUPEQ)
+            emit(Op.JZ, end_label)
+
+        # Executar corpo do loop
+        self.process_statement(stmt.body)
+
+        # Incrementar ou decrementar variável de controle
+        self.emit_load(scope, var_addr)
+        if stmt.direction == 'to':
+            emit(Op.PUSHI, 1)
+            emit(Op.ADD)
+        else:
+            emit(Op.PUSHI, 1)
+            emit(Op.SUB)
+        self.emit_store(scope, var_addr)
+
+        emit(Op.JUMP, start_label)
+        emit(Op.LABEL, end_label)
+        self.temp_depth -= 1
+
+    # Case: o seletor é avaliado uma vez (para um temporário, se não for uma
+    # variável simples) e o ramo é escolhido por testes em sequência, por
+    # pesquisa binária sobre os intervalos de rótulos ou por uma tabela de saltos
+    def process_case(self, stmt):
+        emit = self.emit
+        selector_type = self.get_expression_type(stmt.selector)
+        if selector_type not in ('integer', 'boolean', 'unknown'):
+            raise SyntaxError(f"Seletor do case tem de ser inteiro, linha {stmt.lineno}")
+
+        # Intervalos (mínimo, máximo, ramo) ordenados, sem sobreposições
+        intervals = []
+        for index, branch in enumerate(stmt.branches):
+            for low, high in branch.ranges:
+                if not isinstance(low, int) or not isinstance(high, int) or low > high:
+                    raise SyntaxError(f"Rótulo do case inválido, linha {branch.lineno}")
+                intervals.append((low, high, index))
+        intervals.sort()
+        for previous, current in zip(intervals, intervals[1:]):
+            if current[0] <= previous[1]:
+                raise SyntaxError(f"Rótulo {current[0]} repetido no case, linha {stmt.lineno}")
+
+        if isinstance(stmt.selector, Variable) and not self.is_function_name(stmt.selector.name):
+            self.variable_entry(stmt.selector.name, stmt.selector.lineno)
+            selector = stmt.selector
+        else:
+            selector = Temporary(self.temp_base + self.temp_depth, self.temp_scope, lineno=stmt.lineno)
+            self.process_expression(stmt.selector)
+            self.emit_store(selector.scope, selector.address)
+
+        end_label = self.new_label("endcase")
+        if not intervals:
+            self.process_statement(stmt.else_stmt)
+            emit(Op.LABEL, end_label)
+            return
+
+        # O seletor só é preciso até o ramo ser escolhido, por isso o
+        # temporário pode ser reutilizado pelos statements dos ramos.
+        # Nos procedimentos não se usam tabelas de saltos: os ramos são
+        # chamados com CALL, que muda o FP usado pelas variáveis locais
+        span = intervals[-1][1] - intervals[0][0] + 1
+        covered = sum(high - low + 1 for low, high, _ in intervals)
+        if self.current_procedure is None and len(intervals) > CASE_LINEAR_LIMIT and span <= CASE_TABLE_MAX \
+                and covered >= span * CASE_TABLE_DENSITY:
+            self.emit_case_table(stmt, selector, intervals, end_label)
+        else:
+            self.emit_case_search(stmt, selector, intervals, end_label)
+        emit(Op.LABEL, end_label)
+
+    # Pesquisa: os testes saltam para o rótulo do ramo; cada ramo acaba com um salto para o fim
+    def emit_case_search(self, stmt, selector, intervals, end_label):
+        emit = self.emit
+        branch_labels = [self.new_label("caseof") for _ in stmt.branches]
+        else_label = self.new_label("caseelse") if stmt.else_stmt is not None else end_label
+        targets = [(low, high, branch_labels[index]) for low, high, index in intervals]
+        self.emit_case_tests(selector, targets, else_label)
+
+        if stmt.else_stmt is not None:
+            emit(Op.LABEL, else_label)
+            self.process_statement(stmt.else_stmt)
+            emit(Op.JUMP, end_label)
+        for label, branch in zip(branch_labels, stmt.branches):
+            emit(Op.LABEL, label)
+            self.process_statement(branch.stmt)
+            emit(Op.JUMP, end_label)
+
+    # Testes de um conjunto ordenado de intervalos: em sequência quando são
+    # poucos, senão divide ao meio e compara com o primeiro valor da metade de cima
+    def emit_case_tests(self, selector, targets, default_label):
+        lineno = selector.lineno
+        pending = [(targets, None)]
+        while pending:
+            targets, label = pending.pop()
+            if label is not None:
+                self.emit(Op.LABEL, label)
+            if len(targets) <= CASE_LINEAR_LIMIT:
+                for low, high, target in targets:
+                    if low == high:
+                        test = BinOp('=', selector, Number(low, lineno=lineno), lineno=lineno)
+                    else:
+                        test = BinOp('and', BinOp('>=', selector, Number(low, lineno=lineno), lineno=lineno),
+                                     BinOp('<=', selector, Number(high, lineno=lineno), lineno=lineno), lineno=lineno)
+                    self.process_condition_true(test, target)
+                self.emit(Op.JUMP, default_label)
+                continue
+            middle = len(targets) // 2
+            upper_label = self.new_label("caseupper")
+            test = BinOp('<', selector, Number(targets[middle][0], lineno=lineno), lineno=lineno)
+            self.process_condition(test, upper_label)
+            pending.append((targets[middle:], upper_label))
+            pending.append((targets[:middle], None))
+
+    # Tabela de saltos: uma entrada por valor entre o menor e o maior rótulo com
+    # o endereço do código do ramo, executado como sub-rotina (CALL / RETURN).
+    # Os valores sem rótulo apontam para o else (ou para um RETURN vazio)
+    def emit_case_table(self, stmt, selector, intervals, end_label):
+        emit = self.emit
+        lineno = selector.lineno
+        low = intervals[0][0]
+        high = intervals[-1][1]
+        branch_labels = [self.new_label("caseof") for _ in stmt.branches]
+        else_label = self.new_label("caseelse")
+        entries = [else_label] * (high - low + 1)
+        for first, last, index in intervals:
+            entries[first - low:last - low + 1] = [branch_labels[index]] * (last - first + 1)
+        table = self.next_address
+        self.next_address += len(entries)
+        self.tables.append(entries)
+
+        outside_label = self.new_label("caseout") if stmt.else_stmt is not None else end_label
+        in_range = BinOp('and', BinOp('>=', selector, Number(low, lineno=lineno), lineno=lineno),
+                         BinOp('<=', selector, Number(high, lineno=lineno), lineno=lineno), lineno=lineno)
+        self.process_condition(in_range, outside_label)
+        self.process_expression(selector)
+        emit(Op.PUSHI, table - low)
+        emit(Op.ADD)
+        emit(Op.LOADN)
+        emit(Op.CALL)
+        emit(Op.JUMP, end_label)
+        if stmt.else_stmt is not None:
+            emit(Op.LABEL, outside_label)
+            emit(Op.PUSHA, else_label)
+            emit(Op.CALL)
+            emit(Op.JUMP, end_label)
+
+        for label, branch in zip(branch_labels, stmt.branches):
+            emit(Op.LABEL, label)
+            self.process_statement(branch.stmt)
+            emit(Op.RETURN)
+        emit(Op.LABEL, else_label)
+        self.process_statement(stmt.else_stmt)
+        emit(Op.RETURN)
+
+    # Os temporários da CSE do bloco ficam vivos até ao fim do bloco
+    def process_compound(self, stmt):
+        for temporary in stmt.temporaries:
+            temporary.address = self.temp_base + self.temp_depth
+            temporary.scope = self.temp_scope
+            self.temp_depth += 1
+        for s in stmt.statements:
+            self.process_statement(s)
+        self.temp_depth -= len(stmt.temporaries)
+
+
+# Comparação contrária de cada operador relacional (usada nos saltos quando a condição é verdadeira)
+INVERSE_COMPARISONS = {
+    '=': '<>',
+    '<>': '=',
+    '<': '>=',
+    '>=': '<',
+    '>': '<=',
+    '<=': '>',
+}
+
+
+# Texto escrito por um argumento constante do writeln (string ou inteiro), ou None
+def constant_text(expr):
+    if isinstance(expr, String):
+        return expr.value
+    if isinstance(expr, Number) and isinstance(expr.value, int):
+        return str(expr.value)
+    return None
+
+
+# Separa uma expressão inteira em (expressão, constante) quando é da forma
+# e + c, c + e ou e - c; senão devolve (expr, 0)
+def split_constant(expr):
+    if isinstance(expr, BinOp) and expr.op in ('+', '-'):
+        if isinstance(expr.right, Number) and isinstance(expr.right.value, int):
+            return expr.left, expr.right.value if expr.op == '+' else -expr.right.value
+        if expr.op == '+' and isinstance(expr.left, Number) and isinstance(expr.left.value, int):
+            return expr.right, expr.left.value
+    return expr, 0
+
+
+# Dimensões de um tipo array (também array of array): lista de
+# (lower, upper, stride), tipo dos elementos e número total de elementos.
+# O stride de uma dimensão é o número de elementos de cada posição dessa dimensão
+def array_layout(array_type):
+    ranges = []
+    while isinstance(array_type, ArrayType):
+        ranges.append((array_type.lower, array_type.upper))
+        array_type = array_type.element_type
+    dimensions = []
+    size = 1
+    for lower, upper in reversed(ranges):
+        dimensions.append((lower, upper, size))
+        size *= upper - lower + 1
+    dimensions.reverse()
+    return dimensions, array_type, size
+
+
+# Número máximo de temporários vivos ao mesmo tempo num statement (um por cada for aninhado)
+def max_temporaries(stmt):
+    if isinstance(stmt, For):
+        return 1 + max_temporaries(stmt.body)
+    elif isinstance(stmt, Compound):
+        return len(stmt.temporaries) + max((max_temporaries(s) for s in stmt.statements), default=0)
+    elif isinstance(stmt, If):
+        return max(max_temporaries(stmt.then_stmt), max_temporaries(stmt.else_stmt))
+    elif isinstance(stmt, While):
+        return max_temporaries(stmt.body)
+    elif isinstance(stmt, Case):
+        # O temporário do seletor deixa de estar vivo quando o ramo começa
+        branches = [branch.stmt for branch in stmt.branches] + [stmt.else_stmt]
+        return max([1] + [max_temporaries(s) for s in branches])
+    return 0
+
+
+# Função para compilar um programa com um compilador novo
+def compile(source, optimize=False, inline_threshold=INLINE_THRESHOLD, bounds_check=False,
+            heap_threshold=HEAP_THRESHOLD):
+    return Compiler(optimize, inline_threshold, bounds_check, heap_threshold).compile(source)
+
+
+def compile_file(path, optimize=False, inline_threshold=INLINE_THRESHOLD, bounds_check=False,
+                 heap_threshold=HEAP_THRESHOLD):
+    return Compiler(optimize, inline_threshold, bounds_check, heap_threshold).compile_file(path)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Compilador de Pascal para a EWVM")
+    arg_parser.add_argument("ficheiro", help="programa Pascal a compilar")
+    arg_parser.add_argument("-o", "--output", default="cod_vm.txt", help="ficheiro de saída (cod_vm.txt por omissão)")
+    arg_parser.add_argument("-O", "--optimize", action="store_true", help="otimizar o código VM gerado")
+    arg_parser.add_argument("--inline-threshold", type=int, default=INLINE_THRESHOLD,
+                            help=f"tamanho máximo dos procedimentos expandidos inline com -O ({INLINE_THRESHOLD} por omissão, 0 desliga)")
+    arg_parser.add_argument("--bounds-check", action="store_true",
+                            help="verificar os índices dos arrays em tempo de execução")
+    arg_parser.add_argument("--heap-threshold", type=int, default=HEAP_THRESHOLD,
+                            help=f"arrays com mais elementos do que este limite ficam na heap ({HEAP_THRESHOLD} por omissão, 0 desliga)")
+    arg_parser.add_argument("--format", choices=OUTPUT_FORMATS, default='ewvm',
+                            help="formato da saída: texto EWVM com rótulos (por omissão), pré-ligado ou bytecode")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        program = compile_file(args.ficheiro, args.optimize, args.inline_threshold, args.bounds_check,
+                               args.heap_threshold)
+    except SyntaxError as error:
+        print(error)
+        sys.exit(1)
+    print("Parsing finalizado\nCódigo VM gerado")
+    for rule, (applied, removed) in program.optimization_stats.items():
+        print(f"{rule}: aplicada {applied} vezes, {removed} instruções removidas")
+    program.write(args.output, args.format)
+
+
+if __name__ == "__main__":
+    main()
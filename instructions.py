@@ -0,0 +1,159 @@
+# Representação do código VM gerado pelo compilador. Cada instrução é um
+# opcode (Op: os códigos numéricos de vm.OPCODES e a pseudo-instrução LABEL,
+# que define um rótulo) e um operando inteiro. Os operandos que não são
+# inteiros (strings, reais e nomes de rótulos) são índices numa tabela de
+# constantes partilhada por todos os buffers de uma compilação.
+# O texto EWVM só é gerado uma vez, no fim
+
+import array
+from types import SimpleNamespace
+
+from vm import OPCODES, OPERAND_KIND, Program, VMError
+
+# Código numérico de cada instrução como atributo (Op.PUSHI, ...), mais LABEL.
+# São inteiros simples para emit() não pagar a conversão de um IntEnum
+Op = SimpleNamespace(**{name: code for code, name in enumerate(OPCODES + ['LABEL'])})
+
+# Tipo do operando de cada opcode (None se não tiver operando)
+OPERAND_KINDS = [OPERAND_KIND.get(name) for name in OPCODES] + ['label']
+
+# Texto de cada opcode antes do operando
+PREFIXES = [name if kind is None else name + " " for name, kind in zip(OPCODES, OPERAND_KINDS)] + ['']
+
+
+# Tabela de constantes: cada valor (com o seu tipo, para distinguir a string
+# "x" do rótulo x) é guardado uma única vez
+class ConstantPool:
+    __slots__ = ('values', 'indices')
+
+    def __init__(self):
+        self.values = []
+        self.indices = {}
+
+    def index(self, kind, value):
+        key = (kind, value)
+        index = self.indices.get(key)
+        if index is None:
+            index = self.indices[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def __len__(self):
+        return len(self.values)
+
+
+# Código VM em duas colunas compactas: opcodes e operandos
+class InstructionBuffer:
+    __slots__ = ('opcodes', 'operands', 'constants')
+
+    def __init__(self, constants=None):
+        self.opcodes = array.array('B')
+        self.operands = array.array('q')
+        self.constants = constants if constants is not None else ConstantPool()
+
+    @classmethod
+    def from_instructions(cls, instructions, constants=None):
+        code = cls(constants)
+        for opcode, operand in instructions:
+            code.emit(opcode, operand)
+        return code
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    # Acrescenta uma instrução; operand é o valor (int, float ou str), codificado
+    # aqui conforme o tipo de operando do opcode
+    def emit(self, opcode, operand=None):
+        kind = OPERAND_KINDS[opcode]
+        if kind is None:
+            operand = 0
+        elif kind != 'int':
+            operand = self.constants.index(kind, operand)
+        self.opcodes.append(opcode)
+        self.operands.append(operand)
+
+    # Acrescenta o código de outro buffer (que normalmente usa a mesma tabela de constantes)
+    def extend(self, other):
+        if other.constants is self.constants:
+            self.opcodes.extend(other.opcodes)
+            self.operands.extend(other.operands)
+        else:
+            for opcode, operand in other:
+                self.emit(opcode, operand)
+
+    # Insere o código de outro buffer, com a mesma tabela de constantes, antes da posição index
+    def insert(self, index, other):
+        self.opcodes[index:index] = other.opcodes
+        self.operands[index:index] = other.operands
+
+    def decode(self, i):
+        opcode = self.opcodes[i]
+        kind = OPERAND_KINDS[opcode]
+        operand = self.operands[i]
+        if kind is None:
+            operand = None
+        elif kind != 'int':
+            operand = self.constants.values[operand]
+        return opcode, operand
+
+    # Instruções descodificadas como pares (opcode, valor do operando ou None);
+    # é a forma usada pelas passagens de otimização
+    def __iter__(self):
+        return (self.decode(i) for i in range(len(self.opcodes)))
+
+    # Texto EWVM de todo o código, gerado de uma vez a partir das colunas
+    def text(self):
+        values = self.constants.values
+        lines = []
+        append = lines.append
+        for opcode, operand in zip(self.opcodes, self.operands):
+            kind = OPERAND_KINDS[opcode]
+            if kind is None:
+                append(PREFIXES[opcode])
+            elif kind == 'int':
+                append(f"{PREFIXES[opcode]}{operand}")
+            elif kind == 'string':
+                append(f'{PREFIXES[opcode]}"{values[operand]}"')
+            elif opcode == Op.LABEL:
+                append(f"{values[operand]}:")
+            else:
+                append(f"{PREFIXES[opcode]}{values[operand]}")
+        append("")
+        return "\n".join(lines)
+
+    # Ligação: cada rótulo passa a ser o índice da instrução que marca e as
+    # definições de rótulos saem do código. As strings e os reais ficam numa
+    # tabela de constantes só com os valores usados. O vm.Program resultante
+    # pode ser executado ou escrito pré-ligado (text) ou como bytecode (to_bytes)
+    def link(self):
+        values = self.constants.values
+        labels = {}
+        address = 0
+        for opcode, operand in zip(self.opcodes, self.operands):
+            if opcode == Op.LABEL:
+                labels[values[operand]] = address
+            else:
+                address += 1
+
+        opcodes = array.array('B')
+        operands = array.array('q')
+        constants = []
+        indices = {}
+        for opcode, operand in zip(self.opcodes, self.operands):
+            kind = OPERAND_KINDS[opcode]
+            if opcode == Op.LABEL:
+                continue
+            if kind == 'label':
+                name = values[operand]
+                if name not in labels:
+                    raise VMError(f"Rótulo '{name}' não definido")
+                operand = labels[name]
+            elif kind is not None and kind != 'int':
+                index = indices.get(operand)
+                if index is None:
+                    index = indices[operand] = len(constants)
+                    constants.append(values[operand])
+                operand = index
+            opcodes.append(opcode)
+            operands.append(operand)
+        return Program(opcodes, operands, constants, labels)
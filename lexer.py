@@ -1,7 +1,14 @@
-import ply.lex as lex
+import functools
+import os
 import re
 import sys
 
+# Diretoria do pacote, onde fica a tabela gerada pelo lex (lextab.py)
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LEXTAB = 'lextab'
+REFLAGS = re.IGNORECASE
+
 # Lista de tokens
 tokens = [
     'PROGRAM',
@@ -32,6 +39,7 @@ tokens = [
     'MOD',
     'ARRAY',
     'OF',
+    'CASE',
     'ID',
     'NUMBER',
     'STRING_LITERAL',
@@ -58,121 +66,52 @@ tokens = [
 ]
 
 
-def t_PROGRAM(t):
-    r'program'
-    return t
-
-def t_VAR(t):
-    r'var'
-    return t
-
-def t_BEGIN(t):
-    r'begin'
-    return t
-
-def t_END(t):
-    r'end'
-    return t
-
-def t_FUNCTION(t):
-    r'function'
-    return t
-
-def t_PROCEDURE(t):
-    r'procedure'
-    return t
-
-def t_IF(t):
-    r'if'
-    return t
-
-def t_THEN(t):
-    r'then'
-    return t
-
-def t_ELSE(t):
-    r'else'
-    return t
-
-def t_WHILE(t):
-    r'while'
-    return t
-
-def t_DO(t):
-    r'do\b'
-    return t
-
-def t_AND(t):
-    r'and'
-    return t
-
-def t_OR(t):
-    r'or'
-    return t
-
-def t_FOR(t):
-    r'for'
-    return t
-
-def t_TO(t):
-    r'to'
-    return t
-
-def t_DOWNTO(t):
-    r'downto'
-    return t
-
-def t_WRITELN(t):
-    r'writeln|write'
-    return t
-
-def t_READLN(t):
-    r'readln'
-    return t
-
-def t_INTEGER(t):
-    r'integer'
-    return t
-
-def t_BOOLEAN(t):
-    r'boolean'
-    return t
-
-def t_STRING(t):
-    r'string'
-    return t
-
-def t_REAL(t):
-    r'real'
-    return t
-
-def t_TRUE(t):
-    r'true'
-    return t
-
-def t_FALSE(t):
-    r'false'
-    return t
-
-def t_DIV(t):
-    r'div'
-    return t
-
-def t_MOD(t):
-    r'mod'
-    return t
-
-def t_ARRAY(t):
-    r'array'
-    return t
-
-def t_OF(t):
-    r'of'
-    return t
+# Palavras reservadas: os identificadores são reconhecidos por t_ID e
+# classificados nesta tabela (em minúsculas, porque o Pascal não distingue maiúsculas)
+reserved = {
+    'program': 'PROGRAM',
+    'var': 'VAR',
+    'begin': 'BEGIN',
+    'end': 'END',
+    'function': 'FUNCTION',
+    'procedure': 'PROCEDURE',
+    'if': 'IF',
+    'then': 'THEN',
+    'else': 'ELSE',
+    'while': 'WHILE',
+    'do': 'DO',
+    'and': 'AND',
+    'or': 'OR',
+    'for': 'FOR',
+    'to': 'TO',
+    'downto': 'DOWNTO',
+    'writeln': 'WRITELN',
+    'write': 'WRITELN',
+    'readln': 'READLN',
+    'integer': 'INTEGER',
+    'longint': 'INTEGER',
+    'boolean': 'BOOLEAN',
+    'string': 'STRING',
+    'real': 'REAL',
+    'true': 'TRUE',
+    'false': 'FALSE',
+    'div': 'DIV',
+    'mod': 'MOD',
+    'array': 'ARRAY',
+    'of': 'OF',
+    'case': 'CASE',
+}
 
 
 def t_ID(t):
     r'[a-zA-Z_][a-zA-Z_0-9]*'
+    keyword = t.value.lower()
+    if keyword in reserved:
+        t.type = reserved[keyword]
+        t.value = keyword
+    else:
+        # Cada nome é guardado uma só vez, por mais ocorrências que tenha na AST
+        t.value = sys.intern(t.value)
     return t
 
 
@@ -209,7 +148,7 @@ t_DOT = r'\.'
 t_DOTDOT = r'\.\.'
 
 
-t_ignore = ' \t\n'
+t_ignore = ' \t'
 
 
 def t_COMMENT(t):
@@ -227,12 +166,100 @@ def t_error(t):
     t.lexer.skip(1)
 
 
-lexer = lex.lex(reflags=re.IGNORECASE)
+# Verifica se o lextab.py corresponde às regras deste módulo: a expressão
+# regular, pela ordem em que o lex junta as regras, e os tokens
+def lextab_is_current(lextab, lex):
+    info = lex.LexerReflect(globals(), reflags=REFLAGS)
+    info.get_all()
+    rules = [(name, getattr(func, 'regex', func.__doc__)) for name, func in info.funcsym['INITIAL']] + info.strsym['INITIAL']
+    pattern = "|".join(f"(?P<{name}>{regex})" for name, regex in rules)
+    return (getattr(lextab, '_lexreflags', None) == int(REFLAGS)
+            and lextab._lextokens == set(tokens)
+            and lextab._lexstateignore.get('INITIAL') == t_ignore
+            and "|".join(regex for regex, _ in lextab._lexstatere['INITIAL']) == pattern)
+
+
+# Constrói o lexer na primeira utilização. Com o lextab.py atualizado, o lex
+# corre em modo optimize: não valida o módulo nem junta as regras de novo.
+# Senão constrói-o a partir das regras e regenera o lextab.py na diretoria do pacote
+@functools.cache
+def get_lexer():
+    import ply.lex as lex
+    try:
+        import lextab
+    except ImportError:
+        lextab = None
+    if lextab is not None and lextab_is_current(lextab, lex):
+        return lex.lex(reflags=REFLAGS, optimize=True, lextab=lextab)
+    new_lexer = lex.lex(reflags=REFLAGS)
+    try:
+        new_lexer.writetab(LEXTAB, PACKAGE_DIR)
+    except OSError:
+        pass
+    return new_lexer
+
+
+# lexer.lexer continua disponível, construído só quando é usado
+def __getattr__(name):
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Tamanho (em bytes) dos blocos lidos de cada vez pelo lexer em streaming
+CHUNK_SIZE = 1 << 20
+
+# Comentários e strings podem ocupar várias linhas; o grupo 'open' apanha os
+# que ainda não foram fechados no fim do bloco
+multiline_re = re.compile(rb"\{[^}]*\}|\(\*[^*]*\*\)|'(?:[^\\']|\\.)*'|(?P<open>\{|\(\*|')", re.DOTALL)
+
+
+# Função para encontrar o ponto onde um bloco pode ser cortado sem partir
+# tokens, comentários ou strings: logo a seguir ao último fim de linha que
+# não esteja dentro de um deles
+def safe_cut(block):
+    limit = len(block)
+    spans = []
+    for match in multiline_re.finditer(block):
+        if match.lastgroup == 'open':
+            limit = match.start()
+            break
+        spans.append(match.span())
+    cut = block.rfind(b'\n', 0, limit)
+    for start, end in reversed(spans):
+        if end <= cut:
+            break
+        if start <= cut:
+            cut = block.rfind(b'\n', 0, start)
+    return cut + 1
+
+
+# Gerador de tokens que lê o ficheiro por blocos com f.read(chunk_size), sem
+# carregar o texto todo nem guardar os tokens já produzidos: só o bloco atual
+# fica em memória (com mmap as páginas já lidas continuavam a contar no RSS)
+def tokenize_file(path, local_lexer=None, chunk_size=CHUNK_SIZE):
+    if local_lexer is None:
+        local_lexer = get_lexer().clone()
+    with open(path, 'rb') as f:
+        offset = 0  # posição (em caracteres) do bloco atual no ficheiro
+        pending = b''
+        while True:
+            data = f.read(chunk_size)
+            block = pending + data
+            cut = safe_cut(block) if data else len(block)
+            pending = block[cut:]
+            if cut:
+                text = block[:cut].decode('utf-8')
+                local_lexer.input(text)
+                for tok in iter(local_lexer.token, None):
+                    tok.lexpos += offset
+                    yield tok
+                offset += len(text)
+            if not data:
+                return
+
 
 if __name__ == "__main__":
     ficheiro_test = sys.argv[1]
-    with open(ficheiro_test, 'r') as f:
-        data = f.read()
-    lexer.input(data)
-    for tok in lexer:
+    for tok in tokenize_file(ficheiro_test):
         print(tok)
\ No newline at end of file
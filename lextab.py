@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ARRAY', 'ASSIGN', 'BEGIN', 'BOOLEAN', 'CASE', 'COLON', 'COMMA', 'DIV', 'DIVIDE', 'DO', 'DOT', 'DOTDOT', 'DOWNTO', 'ELSE', 'END', 'EQUAL', 'FALSE', 'FOR', 'FUNCTION', 'GE', 'GT', 'ID', 'IF', 'INTEGER', 'LBRACKET', 'LE', 'LPAREN', 'LT', 'MINUS', 'MOD', 'NE', 'NUMBER', 'OF', 'OR', 'PLUS', 'PROCEDURE', 'PROGRAM', 'RBRACKET', 'READLN', 'REAL', 'RPAREN', 'SEMICOLON', 'STRING', 'STRING_LITERAL', 'THEN', 'TIMES', 'TO', 'TRUE', 'VAR', 'WHILE', 'WRITELN'))
+_lexreflags   = 2
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_ID>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_NUMBER>\\d+)|(?P<t_STRING_LITERAL>\\'([^\\\\\\']|\\\\.)*\\')|(?P<t_COMMENT>\\{[^}]*\\}|\\(\\*[^*]*\\*\\))|(?P<t_newline>\\n+)|(?P<t_DOTDOT>\\.\\.)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_NE><>)|(?P<t_LE><=)|(?P<t_GE>>=)|(?P<t_ASSIGN>:=)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_DOT>\\.)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_EQUAL>=)|(?P<t_LT><)|(?P<t_GT>>)|(?P<t_COLON>:)|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)", [None, ('t_ID', 'ID'), ('t_NUMBER', 'NUMBER'), ('t_STRING_LITERAL', 'STRING_LITERAL'), None, ('t_COMMENT', 'COMMENT'), ('t_newline', 'newline'), (None, 'DOTDOT'), (None, 'PLUS'), (None, 'TIMES'), (None, 'NE'), (None, 'LE'), (None, 'GE'), (None, 'ASSIGN'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'DOT'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'EQUAL'), (None, 'LT'), (None, 'GT'), (None, 'COLON'), (None, 'SEMICOLON'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,291 @@
+# Nós da AST. Cada classe tem um 'kind' (o nome usado nas tabelas de despacho
+# do compilador, process_<kind>) e guarda a linha do código fonte em lineno
+
+import functools
+
+# Número de valores constantes diferentes com nó partilhado (number e string)
+CONSTANT_CACHE_SIZE = 4096
+
+
+class Node:
+    __slots__ = ('lineno',)
+    kind = 'node'
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if name != 'type')
+        return f"{type(self).__name__}({fields})"
+
+
+# Programa e declarações
+class Program(Node):
+    __slots__ = ('name', 'block')
+    kind = 'program'
+
+    def __init__(self, name, block, lineno=0):
+        self.name = name
+        self.block = block
+        self.lineno = lineno
+
+
+class Block(Node):
+    __slots__ = ('declarations', 'procedures', 'statements')
+    kind = 'block'
+
+    def __init__(self, declarations, procedures, statements, lineno=0):
+        self.declarations = declarations
+        self.procedures = procedures
+        self.statements = statements
+        self.lineno = lineno
+
+
+# Procedimento ou função (com return_type): parâmetros por valor como
+# uma lista de VarDeclaration
+class Procedure(Node):
+    __slots__ = ('name', 'block', 'params', 'return_type')
+    kind = 'procedure'
+
+    def __init__(self, name, block, params=(), return_type=None, lineno=0):
+        self.name = name
+        self.block = block
+        self.params = params
+        self.return_type = return_type
+        self.lineno = lineno
+
+
+class VarDeclaration(Node):
+    __slots__ = ('names', 'var_type')
+    kind = 'var'
+
+    def __init__(self, names, var_type, lineno=0):
+        self.names = names
+        self.var_type = var_type
+        self.lineno = lineno
+
+
+class ArrayType(Node):
+    __slots__ = ('lower', 'upper', 'element_type')
+    kind = 'array'
+
+    def __init__(self, lower, upper, element_type, lineno=0):
+        self.lower = lower
+        self.upper = upper
+        self.element_type = element_type
+        self.lineno = lineno
+
+
+# Statements
+class Assignment(Node):
+    __slots__ = ('target', 'expr')
+    kind = 'assignment'
+
+    def __init__(self, target, expr, lineno=0):
+        self.target = target
+        self.expr = expr
+        self.lineno = lineno
+
+
+class Writeln(Node):
+    __slots__ = ('args',)
+    kind = 'writeln'
+
+    def __init__(self, args, lineno=0):
+        self.args = args
+        self.lineno = lineno
+
+
+class Readln(Node):
+    __slots__ = ('target',)
+    kind = 'readln'
+
+    def __init__(self, target, lineno=0):
+        self.target = target
+        self.lineno = lineno
+
+
+class ProcedureCall(Node):
+    __slots__ = ('name', 'args')
+    kind = 'procedure_call'
+
+    def __init__(self, name, args=(), lineno=0):
+        self.name = name
+        self.args = args
+        self.lineno = lineno
+
+
+class If(Node):
+    __slots__ = ('condition', 'then_stmt', 'else_stmt')
+    kind = 'if'
+
+    def __init__(self, condition, then_stmt, else_stmt=None, lineno=0):
+        self.condition = condition
+        self.then_stmt = then_stmt
+        self.else_stmt = else_stmt
+        self.lineno = lineno
+
+
+class While(Node):
+    __slots__ = ('condition', 'body')
+    kind = 'while'
+
+    def __init__(self, condition, body, lineno=0):
+        self.condition = condition
+        self.body = body
+        self.lineno = lineno
+
+
+class For(Node):
+    __slots__ = ('var', 'start', 'end', 'body', 'direction')
+    kind = 'for'
+
+    def __init__(self, var, start, end, body, direction='to', lineno=0):
+        self.var = var
+        self.start = start
+        self.end = end
+        self.body = body
+        self.direction = direction
+        self.lineno = lineno
+
+
+class Case(Node):
+    __slots__ = ('selector', 'branches', 'else_stmt')
+    kind = 'case'
+
+    def __init__(self, selector, branches, else_stmt=None, lineno=0):
+        self.selector = selector
+        self.branches = branches
+        self.else_stmt = else_stmt
+        self.lineno = lineno
+
+
+# Ramo de um case: intervalos de valores (mínimo, máximo) e o statement executado
+class CaseBranch(Node):
+    __slots__ = ('ranges', 'stmt')
+    kind = 'case_branch'
+
+    def __init__(self, ranges, stmt, lineno=0):
+        self.ranges = ranges
+        self.stmt = stmt
+        self.lineno = lineno
+
+
+# Bloco de statements; temporaries são os temporários (Temporary) criados pela
+# CSE, vivos durante todo o bloco
+class Compound(Node):
+    __slots__ = ('statements', 'temporaries')
+    kind = 'compound'
+
+    def __init__(self, statements, temporaries=(), lineno=0):
+        self.statements = statements
+        self.temporaries = temporaries
+        self.lineno = lineno
+
+
+# Expressões: o tipo é calculado uma vez pelo compilador e guardado em 'type'
+class Expression(Node):
+    __slots__ = ()
+
+
+# As constantes não precisam de guardar o tipo: depende só da classe e do valor.
+# São imutáveis, por isso o parser usa um nó por valor (number e string)
+class Number(Expression):
+    __slots__ = ('value',)
+    kind = 'number'
+
+    def __init__(self, value, lineno=0):
+        self.value = value
+        self.lineno = lineno
+
+    @property
+    def type(self):
+        return 'real' if isinstance(self.value, float) else 'integer'
+
+
+class String(Expression):
+    __slots__ = ('value',)
+    kind = 'string'
+    type = 'string'
+
+    def __init__(self, value, lineno=0):
+        self.value = value
+        self.lineno = lineno
+
+
+class Variable(Expression):
+    __slots__ = ('name', 'type')
+    kind = 'variable'
+
+    def __init__(self, name, lineno=0):
+        self.name = name
+        self.type = None
+        self.lineno = lineno
+
+
+# Elemento de array: uma expressão de índice por dimensão
+class ArrayElement(Expression):
+    __slots__ = ('name', 'indices', 'type')
+    kind = 'array_element'
+
+    def __init__(self, name, indices, lineno=0):
+        self.name = name
+        self.indices = indices
+        self.type = None
+        self.lineno = lineno
+
+
+class FunctionCall(Expression):
+    __slots__ = ('name', 'args', 'type')
+    kind = 'function_call'
+
+    def __init__(self, name, args, lineno=0):
+        self.name = name
+        self.args = args
+        self.type = None
+        self.lineno = lineno
+
+
+# Posição reservada pelo compilador (temporários): global ou no frame do
+# procedimento ('local', relativa a FP)
+class Temporary(Expression):
+    __slots__ = ('address', 'scope', 'type')
+    kind = 'temporary'
+
+    def __init__(self, address, scope='global', type='integer', lineno=0):
+        self.address = address
+        self.scope = scope
+        self.type = type
+        self.lineno = lineno
+
+
+class BinOp(Expression):
+    __slots__ = ('op', 'left', 'right', 'type')
+    kind = 'binop'
+
+    def __init__(self, op, left, right, lineno=0):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.type = None
+        self.lineno = lineno
+
+
+STATEMENTS = (Assignment, Writeln, Readln, ProcedureCall, If, While, For, Case, Compound)
+EXPRESSIONS = (Number, String, Variable, ArrayElement, BinOp, Temporary, FunctionCall)
+
+
+# Constrói uma tabela de despacho classe -> handler a partir de um objeto com
+# métodos <prefixo><kind>, para evitar cadeias de if/elif sobre o tipo do nó
+def dispatch_table(handler, prefix, classes):
+    return {cls: getattr(handler, prefix + cls.kind) for cls in classes}
+
+
+# Nó partilhado por todas as ocorrências de uma constante. Nenhum erro indica
+# a linha de uma constante, por isso estes nós não têm linha (lineno 0);
+# typed=True separa 1 de 1.0
+@functools.lru_cache(maxsize=CONSTANT_CACHE_SIZE, typed=True)
+def number(value):
+    return Number(value)
+
+
+@functools.lru_cache(maxsize=CONSTANT_CACHE_SIZE)
+def string(value):
+    return String(value)
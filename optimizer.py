@@ -0,0 +1,838 @@
+# Otimizações sobre a AST e sobre o código VM gerado pelo compilador
+
+from instructions import Op
+from nodes import (ArrayElement, Assignment, BinOp, Case, CaseBranch, Compound, For, FunctionCall, If, Number,
+                   ProcedureCall, Readln, Temporary, Variable, While, Writeln, number)
+from vm import int_div, int_mod
+
+
+def is_label(instruction):
+    return instruction[0] == Op.LABEL
+
+
+# Regras da passagem peephole, sobre as instruções como pares (Op, operando).
+# Cada regra recebe o código e a posição atual e devolve (número de
+# instruções substituídas, instruções novas) ou None se não se aplicar.
+# Os rótulos nunca fazem parte de uma janela, por isso uma regra não junta
+# instruções separadas por um destino de salto
+
+
+# PUSHI 0 / SUB e PUSHI 0 / ADD não alteram o topo da pilha
+# (acontece em todos os acessos a arrays com limite inferior ou endereço base 0)
+def rule_add_sub_zero(code, i):
+    if code[i] == (Op.PUSHI, 0) and i + 1 < len(code) and code[i + 1][0] in (Op.ADD, Op.SUB):
+        return 2, []
+    return None
+
+
+# JUMP L seguido (eventualmente depois de outros rótulos) do próprio rótulo L
+def rule_jump_to_next(code, i):
+    name, target = code[i]
+    if name != Op.JUMP:
+        return None
+    j = i + 1
+    while j < len(code) and is_label(code[j]):
+        if code[j][1] == target:
+            return 1, []
+        j += 1
+    return None
+
+
+STORE_LOADS = {Op.STOREG: Op.PUSHG, Op.STOREL: Op.PUSHL}
+
+
+# STOREG n / PUSHG n (ou STOREL n / PUSHL n): duplica o valor antes de o
+# guardar em vez de o voltar a ler
+def rule_store_load(code, i):
+    name, operand = code[i]
+    load = STORE_LOADS.get(name)
+    if load is not None and i + 1 < len(code) and code[i + 1] == (load, operand):
+        return 2, [(Op.DUP, 1), code[i]]
+    return None
+
+
+PEEPHOLE_RULES = [
+    ('add_sub_zero', rule_add_sub_zero),
+    ('jump_to_next', rule_jump_to_next),
+    ('store_load', rule_store_load),
+]
+
+
+# Aplica as regras até não haver mais alterações. Devolve o código novo e,
+# para cada regra, (vezes que foi aplicada, instruções removidas)
+def peephole(code, rules=PEEPHOLE_RULES):
+    stats = {name: [0, 0] for name, _ in rules}
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        i = 0
+        while i < len(code):
+            match = None
+            if not is_label(code[i]):
+                for name, rule in rules:
+                    match = rule(code, i)
+                    if match is not None:
+                        break
+            if match is None:
+                result.append(code[i])
+                i += 1
+                continue
+            length, replacement = match
+            result.extend(replacement)
+            stats[name][0] += 1
+            stats[name][1] += length - len(replacement)
+            i += length
+            changed = True
+        code = result
+    return code, {name: tuple(counts) for name, counts in stats.items()}
+
+
+# Operações avaliadas em tempo de compilação quando os dois operandos são
+# constantes, com a mesma semântica das instruções que o compilador emitiria
+FOLD_OPERATIONS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    'div': int_div,
+    'mod': int_mod,
+    '=': lambda a, b: int(a == b),
+    '<>': lambda a, b: int(a != b),
+    '<': lambda a, b: int(a < b),
+    '<=': lambda a, b: int(a <= b),
+    '>': lambda a, b: int(a > b),
+    '>=': lambda a, b: int(a >= b),
+    'and': lambda a, b: int(a != 0 and b != 0),
+    'or': lambda a, b: int(a != 0 or b != 0),
+}
+
+
+def is_constant(expr):
+    return isinstance(expr, Number)
+
+
+# Os booleanos são inteiros na VM, por isso trocar um pelo outro não muda o código gerado
+def same_type(a, b):
+    return a == b or (a in ('integer', 'boolean') and b in ('integer', 'boolean'))
+
+
+# Avalia uma binop com dois operandos constantes; devolve None se não for possível
+def fold_constants(op, left, right, using_real):
+    if op in ('/', 'div', 'mod') and right == 0:
+        return None
+    if using_real:
+        if op in ('div', 'mod'):
+            return None
+        left, right = float(left), float(right)
+    if op == '/':
+        return left / right if using_real else int_div(left, right)
+    return FOLD_OPERATIONS[op](left, right)
+
+
+def is_value(expr, value):
+    return isinstance(expr, Number) and expr.value == value
+
+
+# Simplifica identidades com um operando constante (x + 0, x * 1, x div 1, ...).
+# x * 0 e x mod 1 só passam a 0 se x puder deixar de ser avaliado (is_droppable)
+def simplify_identity(op, left, right, effects):
+    if op == '+':
+        if is_value(right, 0):
+            return left
+        if is_value(left, 0):
+            return right
+    elif op == '-':
+        if is_value(right, 0):
+            return left
+    elif op == '*':
+        if is_value(right, 1):
+            return left
+        if is_value(left, 1):
+            return right
+        if (is_value(left, 0) and is_droppable(right, effects)) or (is_value(right, 0) and is_droppable(left, effects)):
+            return number(0)
+    elif op in ('/', 'div'):
+        if is_value(right, 1):
+            return left
+    elif op == 'mod':
+        if is_value(right, 1) and is_droppable(left, effects):
+            return number(0)
+    return None
+
+
+# Dobragem de constantes numa expressão. type_of é a função de tipos do
+# compilador; uma simplificação só é feita se não mudar o tipo da expressão
+def fold_expression(expr, type_of, effects):
+    if isinstance(expr, ArrayElement):
+        return ArrayElement(expr.name, [fold_expression(index, type_of, effects) for index in expr.indices], lineno=expr.lineno)
+    if isinstance(expr, FunctionCall):
+        return FunctionCall(expr.name, [fold_expression(arg, type_of, effects) for arg in expr.args], lineno=expr.lineno)
+    if not isinstance(expr, BinOp):
+        return expr
+
+    # Cadeias associadas à esquerda são dobradas sem recursão, de baixo para cima
+    chain = []
+    while isinstance(expr, BinOp):
+        chain.append(expr)
+        expr = expr.left
+    left = fold_expression(expr, type_of, effects)
+    for node in reversed(chain):
+        left = fold_binop(node, left, fold_expression(node.right, type_of, effects), type_of, effects)
+    return left
+
+
+def fold_binop(node, left, right, type_of, effects):
+    if left is node.left and right is node.right:
+        folded = node
+    else:
+        folded = BinOp(node.op, left, right, lineno=node.lineno)
+    expr_type = type_of(folded)
+
+    if is_constant(left) and is_constant(right):
+        using_real = type_of(left) == 'real' or type_of(right) == 'real'
+        value = fold_constants(node.op, left.value, right.value, using_real)
+        result = None if value is None else number(value)
+    else:
+        result = simplify_identity(node.op, left, right, effects)
+    if result is not None and same_type(type_of(result), expr_type):
+        return result
+    return folded
+
+
+# Dobragem de constantes num statement; if e while com condições constantes
+# são substituídos pelo ramo executado (ou por nada). A AST original não é alterada.
+# effects(nome) devolve os nomes globais escritos por uma chamada ao
+# procedimento ou função nome (None se nome não for um procedimento)
+def fold_statement(stmt, type_of, effects):
+    if stmt is None:
+        return None
+    return FOLD_STATEMENT[type(stmt)](stmt, type_of, effects)
+
+
+def fold_assignment(stmt, type_of, effects):
+    return Assignment(fold_expression(stmt.target, type_of, effects), fold_expression(stmt.expr, type_of, effects),
+                      lineno=stmt.lineno)
+
+
+def fold_writeln(stmt, type_of, effects):
+    return Writeln([fold_expression(expr, type_of, effects) for expr in stmt.args], lineno=stmt.lineno)
+
+
+def fold_readln(stmt, type_of, effects):
+    return Readln(fold_expression(stmt.target, type_of, effects), lineno=stmt.lineno)
+
+
+def fold_if(stmt, type_of, effects):
+    condition = fold_expression(stmt.condition, type_of, effects)
+    then_stmt = fold_body(stmt.then_stmt, type_of, effects)
+    else_stmt = fold_body(stmt.else_stmt, type_of, effects)
+    if is_constant(condition):
+        return then_stmt if condition.value != 0 else else_stmt
+    return If(condition, then_stmt, else_stmt, lineno=stmt.lineno)
+
+
+def fold_while(stmt, type_of, effects):
+    condition = fold_expression(stmt.condition, type_of, effects)
+    if is_value(condition, 0):
+        return None
+    return While(condition, fold_body(stmt.body, type_of, effects), lineno=stmt.lineno)
+
+
+def fold_for(stmt, type_of, effects):
+    return For(stmt.var, fold_expression(stmt.start, type_of, effects), fold_expression(stmt.end, type_of, effects),
+               fold_body(stmt.body, type_of, effects), stmt.direction, lineno=stmt.lineno)
+
+
+# Um case com seletor constante é substituído pelo ramo escolhido
+def fold_case(stmt, type_of, effects):
+    selector = fold_expression(stmt.selector, type_of, effects)
+    else_stmt = fold_body(stmt.else_stmt, type_of, effects)
+    branches = [CaseBranch(branch.ranges, fold_body(branch.stmt, type_of, effects), lineno=branch.lineno)
+                for branch in stmt.branches]
+    if is_constant(selector) and isinstance(selector.value, int):
+        for branch in branches:
+            if any(low <= selector.value <= high for low, high in branch.ranges):
+                return branch.stmt
+        return else_stmt
+    return Case(selector, branches, else_stmt, lineno=stmt.lineno)
+
+
+# Corpo de um ciclo, ramo de um if ou de um case: um statement simples também
+# é um bloco para a CSE e a LICM, mas só fica dentro de um Compound se elas o alterarem
+def fold_body(stmt, type_of, effects):
+    if stmt is None or isinstance(stmt, Compound):
+        return fold_statement(stmt, type_of, effects)
+    folded = fold_compound(Compound([stmt], lineno=stmt.lineno), type_of, effects)
+    if folded.temporaries:
+        return folded
+    return folded.statements[0]
+
+
+# Os invariantes de cada ciclo do bloco são calculados antes dele (LICM), antes
+# de dobrar o ciclo para que os ciclos interiores não voltem a encontrar os
+# mesmos invariantes; o ciclo e as definições ficam num Compound com os
+# temporários da LICM. Depois da dobragem, o bloco passa pela CSE
+def fold_compound(stmt, type_of, effects):
+    statements = []
+    for s in stmt.statements:
+        if isinstance(s, (While, For)):
+            definitions, s, hoisted = hoist_invariants(s, type_of, effects)
+            if hoisted:
+                s = Compound(definitions + [s], hoisted, lineno=s.lineno)
+        statements.append(fold_statement(s, type_of, effects))
+    statements, temporaries = eliminate_common_subexpressions(statements, type_of, effects)
+    return Compound(statements, list(stmt.temporaries) + temporaries, lineno=stmt.lineno)
+
+
+def fold_procedure_call(stmt, type_of, effects):
+    return ProcedureCall(stmt.name, [fold_expression(arg, type_of, effects) for arg in stmt.args], lineno=stmt.lineno)
+
+
+FOLD_STATEMENT = {
+    Assignment: fold_assignment,
+    Writeln: fold_writeln,
+    Readln: fold_readln,
+    If: fold_if,
+    While: fold_while,
+    For: fold_for,
+    Case: fold_case,
+    Compound: fold_compound,
+    ProcedureCall: fold_procedure_call,
+}
+
+
+# Eliminação de subexpressões comuns (CSE) dentro de um bloco de statements.
+# Só as operações aritméticas e as leituras de elementos de arrays são
+# candidatas: as comparações e and/or das condições são compiladas em saltos
+CSE_OPERATORS = ('+', '-', '*', '/', 'div', 'mod')
+
+# Peso de uma ocorrência dentro de um ramo de if: o ramo pode não ser executado
+BRANCH_WEIGHT = 0.25
+
+
+# Numeração de valores: expressões puras com a mesma estrutura recebem o mesmo
+# número, e cada número guarda os nomes (variáveis e arrays) de que depende.
+# As expressões com chamadas de funções (também as funções sem argumentos,
+# escritas como variáveis) não são puras e não têm número
+class ValueNumbering:
+    def __init__(self, effects):
+        self.effects = effects
+        self.numbers = {}  # chave (tipo de nó, operandos) -> número
+        self.dependencies = []  # número -> nomes lidos pela expressão
+        self.node_numbers = {}  # id do nó -> número (None se não for pura)
+
+    def key_number(self, key, dependencies):
+        number = self.numbers.get(key)
+        if number is None:
+            number = self.numbers[key] = len(self.dependencies)
+            self.dependencies.append(dependencies)
+        return number
+
+    # Número de uma expressão, calculado dos filhos para o pai com uma pilha explícita
+    def number(self, expr):
+        node_numbers = self.node_numbers
+        stack = [expr]
+        while stack:
+            node = stack[-1]
+            if id(node) in node_numbers:
+                stack.pop()
+                continue
+            children = expression_children(node)
+            pending = [child for child in children if id(child) not in node_numbers]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            numbers = [node_numbers[id(child)] for child in children]
+            if is_call(node, self.effects) or None in numbers:
+                node_numbers[id(node)] = None
+                continue
+            dependencies = frozenset().union(*(self.dependencies[n] for n in numbers))
+            if isinstance(node, Number):
+                key = ('number', type(node.value), node.value)
+            elif isinstance(node, Variable):
+                key = ('variable', node.name)
+                dependencies = frozenset((node.name,))
+            elif isinstance(node, ArrayElement):
+                key = ('element', node.name) + tuple(numbers)
+                dependencies = dependencies | {node.name}
+            elif isinstance(node, BinOp):
+                key = ('binop', node.op) + tuple(numbers)
+            elif isinstance(node, Temporary):
+                # O temporário é o seu próprio nome nas dependências
+                key = ('node', id(node))
+                dependencies = frozenset((node,))
+            else:
+                # Strings: iguais só a si próprias
+                key = ('node', id(node))
+            node_numbers[id(node)] = self.key_number(key, dependencies)
+        return node_numbers[id(expr)]
+
+
+def is_call(expr, effects):
+    return isinstance(expr, FunctionCall) or (isinstance(expr, Variable) and effects(expr.name) is not None)
+
+
+# Subexpressões de um nó, pela ordem em que o código as avalia
+def expression_children(expr):
+    if isinstance(expr, BinOp):
+        return (expr.left, expr.right)
+    if isinstance(expr, ArrayElement):
+        return tuple(expr.indices)
+    if isinstance(expr, FunctionCall):
+        return tuple(expr.args)
+    return ()
+
+
+# Expressão sem chamadas de funções em nenhuma subexpressão
+def is_pure(expr, effects):
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if is_call(node, effects):
+            return False
+        stack.extend(expression_children(node))
+    return True
+
+
+def is_cse_candidate(expr):
+    return isinstance(expr, ArrayElement) or (isinstance(expr, BinOp) and expr.op in CSE_OPERATORS)
+
+
+# Estimativa do número de instruções que calculam uma expressão
+def expression_size(expr):
+    size = 0
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, BinOp):
+            size += 1
+        elif isinstance(node, ArrayElement):
+            if any(not isinstance(index, Number) for index in node.indices):
+                size += 3 * len(node.indices)  # strides, somas, offset e LOADN
+            else:
+                size += 1
+        else:
+            size += 1
+        stack.extend(expression_children(node))
+    return size
+
+
+# Uma ocorrência de um valor disponível: a primeira ocorrência (que o calcula)
+# e as seguintes, com o peso de cada uma (1 fora de ramos, BRANCH_WEIGHT por cada if)
+class CommonSubexpression:
+    __slots__ = ('expr', 'position', 'occurrences', 'weight', 'temporary')
+
+    def __init__(self, expr, position):
+        self.expr = expr
+        self.position = position  # Statement do bloco antes do qual o valor é calculado
+        self.occurrences = [expr]
+        self.weight = 1.0
+        self.temporary = None
+
+    # Vale a pena guardar o valor num temporário (um STORE e uma leitura por
+    # ocorrência) em vez de o recalcular em cada ocorrência
+    def profitable(self):
+        size = expression_size(self.expr)
+        return (self.weight - 1) * size > 1 + self.weight
+
+
+# Análise de um bloco: percorre as expressões pela ordem de avaliação e agrupa
+# as ocorrências de cada valor enquanto está disponível. Uma atribuição (ou
+# readln) invalida os valores que dependem da variável ou do array escrito;
+# while, for, case, chamadas de procedimentos e statements com chamadas de
+# funções invalidam tudo. Os valores só são calculados fora dos ramos dos if e
+# dos blocos begin/end aninhados (position None), porque o temporário é
+# calculado antes do statement inteiro, mas podem ser reutilizados dentro deles
+class AvailableExpressions:
+    def __init__(self, effects):
+        self.numbering = ValueNumbering(effects)
+        self.available = {}  # número -> CommonSubexpression
+        self.found = []
+
+    def kill(self, name):
+        dependencies = self.numbering.dependencies
+        self.available = {number: cse for number, cse in self.available.items() if name not in dependencies[number]}
+
+    def kill_all(self):
+        self.available = {}
+
+    # skip é um nó que não conta como ocorrência (nem os seus filhos)
+    def visit_expression(self, expr, position, weight, skip=None):
+        self.numbering.number(expr)
+        node_numbers = self.numbering.node_numbers
+        stack = [(expr, False)]
+        while stack:
+            node, visited = stack.pop()
+            if node is skip:
+                continue
+            number = node_numbers[id(node)]
+            candidate = number is not None and is_cse_candidate(node)
+            if visited:
+                # Primeira ocorrência, depois dos filhos: só fora dos ramos e blocos aninhados
+                if candidate and position is not None and number not in self.available:
+                    cse = CommonSubexpression(node, position)
+                    self.available[number] = cse
+                    self.found.append(cse)
+                continue
+            if candidate and number in self.available:
+                cse = self.available[number]
+                cse.occurrences.append(node)
+                cse.weight += weight
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(expression_children(node)))
+
+    # Devolve False se o statement invalida tudo (e não foi analisado)
+    def visit_statement(self, stmt, position, weight):
+        if stmt is None:
+            return True
+        if not is_straight_line(stmt, self.numbering.effects):
+            self.kill_all()
+            return False
+        if isinstance(stmt, Assignment):
+            self.visit_expression(stmt.expr, position, weight, self.reused_element(stmt))
+            self.visit_target(stmt.target, position, weight)
+        elif isinstance(stmt, Readln):
+            self.visit_target(stmt.target, position, weight)
+        elif isinstance(stmt, Writeln):
+            for expr in stmt.args:
+                self.visit_expression(expr, position, weight)
+        elif isinstance(stmt, If):
+            self.visit_condition(stmt.condition, position, weight)
+            self.visit_statement(stmt.then_stmt, None, weight * BRANCH_WEIGHT)
+            self.visit_statement(stmt.else_stmt, None, weight * BRANCH_WEIGHT)
+        elif isinstance(stmt, Compound):
+            for s in stmt.statements:
+                self.visit_statement(s, None, weight)
+        return True
+
+    # Condição de um if: and/or são avaliados em curto-circuito
+    # (Compiler.process_condition), por isso só a cadeia de operandos à
+    # esquerda é sempre avaliada. Os operandos à direita podem reutilizar
+    # valores mas não os começar, porque o temporário seria calculado antes da
+    # guarda (como em loop_expressions)
+    def visit_condition(self, expr, position, weight):
+        rights = []
+        while isinstance(expr, BinOp) and expr.op in ('and', 'or'):
+            rights.append(expr.right)
+            expr = expr.left
+        self.visit_expression(expr, position, weight)
+        for right in reversed(rights):
+            self.visit_expression(right, None, weight * BRANCH_WEIGHT)
+
+    # Em a[i] := a[i] op ..., a leitura de a[i] reutiliza o endereço do destino
+    # (Compiler.reuse_element_address) e não precisa de um temporário
+    def reused_element(self, stmt):
+        expr = stmt.expr
+        if not isinstance(stmt.target, ArrayElement) or not isinstance(expr, BinOp):
+            return None
+        while isinstance(expr, BinOp):
+            expr = expr.left
+        number = self.numbering.number(stmt.target)
+        if number is not None and self.numbering.number(expr) == number:
+            return expr
+        return None
+
+    def visit_target(self, target, position, weight):
+        if isinstance(target, ArrayElement):
+            for index in target.indices:
+                self.visit_expression(index, position, weight)
+        if not isinstance(target, Temporary):
+            self.kill(target.name)
+
+
+# Statements analisados pela CSE: atribuições, writeln, readln e if/blocos
+# formados só por eles, sem chamadas de funções
+def is_straight_line(stmt, effects):
+    stack = [stmt]
+    expressions = []
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node, Assignment):
+            expressions.extend((node.expr, node.target))
+        elif isinstance(node, Readln):
+            expressions.append(node.target)
+        elif isinstance(node, Writeln):
+            expressions.extend(node.args)
+        elif isinstance(node, If):
+            expressions.append(node.condition)
+            stack.extend((node.then_stmt, node.else_stmt))
+        elif isinstance(node, Compound):
+            stack.extend(node.statements)
+        else:
+            return False
+    while expressions:
+        expr = expressions.pop()
+        if is_call(expr, effects):
+            return False
+        expressions.extend(expression_children(expr))
+    return True
+
+
+# CSE num bloco: cada valor escolhido é calculado uma vez para um temporário
+# (Temporary, com o endereço atribuído na geração de código) antes do statement
+# onde aparece pela primeira vez, e as ocorrências passam a ler o temporário.
+# Devolve os statements novos e os temporários usados
+def eliminate_common_subexpressions(statements, type_of, effects):
+    analysis = AvailableExpressions(effects)
+    for position, stmt in enumerate(statements):
+        analysis.visit_statement(stmt, position, 1.0)
+    chosen = [cse for cse in analysis.found if len(cse.occurrences) > 1 and cse.profitable()]
+    if not chosen:
+        return statements, []
+
+    replacements = {}
+    for cse in chosen:
+        cse.temporary = Temporary(None, None, type_of(cse.expr), lineno=cse.expr.lineno)
+        for node in cse.occurrences:
+            replacements[id(node)] = cse.temporary
+
+    # As definições vêm pela ordem em que foram encontradas (subexpressões primeiro)
+    definitions = {}
+    for cse in chosen:
+        expr = substitute_expression(cse.expr, replacements, keep_root=True)
+        definitions.setdefault(cse.position, []).append(Assignment(cse.temporary, expr, lineno=cse.expr.lineno))
+    result = []
+    for position, stmt in enumerate(statements):
+        result.extend(definitions.get(position, ()))
+        result.append(substitute_statement(stmt, replacements))
+    return result, [cse.temporary for cse in chosen]
+
+
+# Cópia de uma expressão com os nós de replacements (por id) trocados pelos
+# temporários; com keep_root a raiz não é trocada
+def substitute_expression(expr, replacements, keep_root=False):
+    if not keep_root and id(expr) in replacements:
+        return replacements[id(expr)]
+    if isinstance(expr, ArrayElement):
+        return ArrayElement(expr.name, [substitute_expression(index, replacements) for index in expr.indices],
+                            lineno=expr.lineno)
+    if isinstance(expr, FunctionCall):
+        return FunctionCall(expr.name, [substitute_expression(arg, replacements) for arg in expr.args],
+                            lineno=expr.lineno)
+    if not isinstance(expr, BinOp):
+        return expr
+
+    # Cadeias associadas à esquerda sem recursão, como em fold_expression
+    chain = [expr]
+    node = expr.left
+    while isinstance(node, BinOp) and id(node) not in replacements:
+        chain.append(node)
+        node = node.left
+    left = substitute_expression(node, replacements)
+    for node in reversed(chain):
+        right = substitute_expression(node.right, replacements)
+        if left is not node.left or right is not node.right:
+            node = BinOp(node.op, left, right, lineno=node.lineno)
+        left = node
+    return left
+
+
+def substitute_statement(stmt, replacements):
+    if isinstance(stmt, Assignment):
+        return Assignment(substitute_expression(stmt.target, replacements, keep_root=True),
+                          substitute_expression(stmt.expr, replacements), lineno=stmt.lineno)
+    if isinstance(stmt, Readln):
+        return Readln(substitute_expression(stmt.target, replacements, keep_root=True), lineno=stmt.lineno)
+    if isinstance(stmt, Writeln):
+        return Writeln([substitute_expression(expr, replacements) for expr in stmt.args], lineno=stmt.lineno)
+    if isinstance(stmt, If):
+        return If(substitute_expression(stmt.condition, replacements), substitute_statement(stmt.then_stmt, replacements),
+                  substitute_statement(stmt.else_stmt, replacements), lineno=stmt.lineno)
+    if isinstance(stmt, Compound):
+        return Compound([substitute_statement(s, replacements) for s in stmt.statements], stmt.temporaries,
+                        lineno=stmt.lineno)
+    if isinstance(stmt, While):
+        return While(substitute_expression(stmt.condition, replacements), substitute_statement(stmt.body, replacements),
+                     lineno=stmt.lineno)
+    if isinstance(stmt, For):
+        return For(stmt.var, substitute_expression(stmt.start, replacements),
+                   substitute_expression(stmt.end, replacements), substitute_statement(stmt.body, replacements),
+                   stmt.direction, lineno=stmt.lineno)
+    if isinstance(stmt, Case):
+        branches = [CaseBranch(branch.ranges, substitute_statement(branch.stmt, replacements), lineno=branch.lineno)
+                    for branch in stmt.branches]
+        return Case(substitute_expression(stmt.selector, replacements), branches,
+                    substitute_statement(stmt.else_stmt, replacements), lineno=stmt.lineno)
+    if isinstance(stmt, ProcedureCall):
+        return ProcedureCall(stmt.name, [substitute_expression(arg, replacements) for arg in stmt.args],
+                             lineno=stmt.lineno)
+    return stmt
+
+
+# Movimento de código invariante nos ciclos (LICM). Uma expressão de um ciclo
+# é invariante se nenhum dos nomes de que depende é escrito no ciclo, nem
+# diretamente nem pelos procedimentos e funções chamados. Cada valor
+# invariante é calculado uma vez para um temporário antes do ciclo.
+
+# Nomes escritos por um statement (destinos de atribuições e readln,
+# variáveis de for) e nomes referidos que podem ser chamadas (procedimentos,
+# funções e variáveis, que podem ser funções sem argumentos)
+def statement_names(stmt):
+    written = set()
+    referenced = set()
+    statements = [stmt]
+    expressions = []
+    while statements:
+        node = statements.pop()
+        if node is None:
+            continue
+        if isinstance(node, Assignment):
+            target = node.target
+            written.add(target if isinstance(target, Temporary) else target.name)
+            expressions.extend((node.expr, target))
+        elif isinstance(node, Readln):
+            written.add(node.target.name)
+            expressions.append(node.target)
+        elif isinstance(node, Writeln):
+            expressions.extend(node.args)
+        elif isinstance(node, ProcedureCall):
+            referenced.add(node.name)
+            expressions.extend(node.args)
+        elif isinstance(node, If):
+            expressions.append(node.condition)
+            statements.extend((node.then_stmt, node.else_stmt))
+        elif isinstance(node, While):
+            expressions.append(node.condition)
+            statements.append(node.body)
+        elif isinstance(node, For):
+            written.add(node.var)
+            expressions.extend((node.start, node.end))
+            statements.append(node.body)
+        elif isinstance(node, Case):
+            expressions.append(node.selector)
+            statements.extend(branch.stmt for branch in node.branches)
+            statements.append(node.else_stmt)
+        elif isinstance(node, Compound):
+            statements.extend(node.statements)
+    while expressions:
+        expr = expressions.pop()
+        if isinstance(expr, (FunctionCall, Variable)):
+            referenced.add(expr.name)
+        expressions.extend(expression_children(expr))
+    return written, referenced
+
+
+# Nomes escritos num ciclo, incluindo os globais escritos pelas chamadas
+def loop_writes(loop, effects):
+    written, referenced = statement_names(loop)
+    for name in referenced:
+        written.update(effects(name) or ())
+    return written
+
+
+# Uma expressão pode ser calculada antes do ciclo mesmo que o ciclo não
+# chegue a avaliá-la (zero iterações, ramos de if) se não puder falhar: sem
+# divisões por valores não constantes ou zero e sem elementos de arrays com
+# índices calculados (os índices constantes são verificados na compilação)
+def is_speculable(expr):
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, BinOp) and node.op in ('/', 'div', 'mod'):
+            if not isinstance(node.right, Number) or node.right.value == 0:
+                return False
+        elif isinstance(node, ArrayElement):
+            if not all(isinstance(index, Number) for index in node.indices):
+                return False
+        stack.extend(expression_children(node))
+    return True
+
+
+# Expressão que pode deixar de ser avaliada sem mudar o programa: sem chamadas
+# e sem nada que possa falhar em tempo de execução (is_speculable). Também não
+# pode ter elementos de arrays: um índice constante fora dos limites é um erro
+# de compilação, que desapareceria com a expressão
+def is_droppable(expr, effects):
+    if not is_pure(expr, effects) or not is_speculable(expr):
+        return False
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ArrayElement):
+            return False
+        stack.extend(expression_children(node))
+    return True
+
+
+# Só vale a pena guardar num temporário o que, depois de dobrado, custa mais
+# do que a leitura do temporário
+def is_worth_hoisting(expr, type_of, effects):
+    folded = fold_expression(expr, type_of, effects)
+    return is_cse_candidate(folded) and expression_size(folded) > 1
+
+
+# Expressões avaliadas em cada iteração, com a indicação de serem sempre
+# avaliadas à entrada do ciclo: só a condição de um while, até ao primeiro
+# operando direito de um and/or (avaliados em curto-circuito)
+def loop_expressions(loop):
+    roots = []
+    if isinstance(loop, While):
+        roots.append((loop.condition, True))
+    statements = [loop.body]
+    while statements:
+        node = statements.pop()
+        if node is None:
+            continue
+        if isinstance(node, Assignment):
+            roots.append((node.expr, False))
+            if isinstance(node.target, ArrayElement):
+                roots.extend((index, False) for index in node.target.indices)
+        elif isinstance(node, Readln):
+            if isinstance(node.target, ArrayElement):
+                roots.extend((index, False) for index in node.target.indices)
+        elif isinstance(node, (Writeln, ProcedureCall)):
+            roots.extend((arg, False) for arg in node.args)
+        elif isinstance(node, If):
+            roots.append((node.condition, False))
+            statements.extend((node.then_stmt, node.else_stmt))
+        elif isinstance(node, While):
+            roots.append((node.condition, False))
+            statements.append(node.body)
+        elif isinstance(node, For):
+            roots.extend(((node.start, False), (node.end, False)))
+            statements.append(node.body)
+        elif isinstance(node, Case):
+            roots.append((node.selector, False))
+            statements.extend(branch.stmt for branch in node.branches)
+            statements.append(node.else_stmt)
+        elif isinstance(node, Compound):
+            statements.extend(node.statements)
+    return roots
+
+
+# LICM num ciclo: devolve as atribuições aos temporários (a pôr antes do
+# ciclo), o ciclo que lê os temporários e os temporários criados. Só as
+# expressões invariantes maximais são movidas, uma vez por valor
+def hoist_invariants(loop, type_of, effects):
+    if isinstance(loop, While) and is_value(fold_expression(loop.condition, type_of, effects), 0):
+        return [], loop, []
+    written = loop_writes(loop, effects)
+    numbering = ValueNumbering(effects)
+    hoisted = {}  # número -> temporário
+    definitions = []
+    replacements = {}
+    for root, on_entry in loop_expressions(loop):
+        numbering.number(root)
+        stack = [(root, on_entry)]
+        while stack:
+            node, on_entry = stack.pop()
+            number = numbering.node_numbers[id(node)]
+            if number is not None and is_cse_candidate(node) and written.isdisjoint(numbering.dependencies[number]):
+                temporary = hoisted.get(number)
+                if temporary is None and (on_entry or is_speculable(node)) and is_worth_hoisting(node, type_of, effects):
+                    temporary = hoisted[number] = Temporary(None, None, type_of(node), lineno=node.lineno)
+                    definitions.append(Assignment(temporary, node, lineno=node.lineno))
+                if temporary is not None:
+                    replacements[id(node)] = temporary
+                    continue
+            if isinstance(node, BinOp) and node.op in ('and', 'or'):
+                stack.extend(((node.right, False), (node.left, on_entry)))
+            else:
+                stack.extend((child, on_entry) for child in reversed(expression_children(node)))
+    if not definitions:
+        return [], loop, []
+    return definitions, substitute_statement(loop, replacements), [definition.target for definition in definitions]
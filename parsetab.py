@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AND ARRAY ASSIGN BEGIN BOOLEAN COLON COMMA DIV DIVIDE DO DOT DOTDOT DOWNTO ELSE END EQUAL FALSE FOR FUNCTION GE GT ID IF INTEGER LBRACKET LE LPAREN LT MINUS MOD NE NUMBER OF OR PLUS PROCEDURE PROGRAM RBRACKET READLN REAL RPAREN SEMICOLON STRING STRING_LITERAL THEN TIMES TO TRUE VAR WHILE WRITELNprogram : PROGRAM ID SEMICOLON block DOTblock : declarations procedures BEGIN statements ENDprocedures : procedure_declaration procedures\n                  | emptyprocedure_declaration : PROCEDURE ID SEMICOLON procedure_block SEMICOLONprocedure_block : declarations BEGIN statements ENDdeclarations : VAR var_declaration_list\n                    | emptyvar_declaration_list : var_declaration SEMICOLON var_declaration_list\n                            | var_declaration SEMICOLONvar_declaration : id_list COLON typeid_list : ID\n               | ID COMMA id_listarray_type : ARRAY LBRACKET NUMBER DOTDOT NUMBER RBRACKET OF typetype : INTEGER\n            | BOOLEAN\n            | STRING\n            | REAL\n            | array_typestatements : statement SEMICOLON statements\n                  | statementstatement : assignment\n                 | writeln\n                 | readln\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | compound_statement\n                 | procedure_call\n                 | emptyprocedure_call : IDcompound_statement : BEGIN statements ENDassignment : variable ASSIGN expressionvariable : ID\n                | ID LBRACKET expression RBRACKETwriteln : WRITELN LPAREN expression_list RPARENexpression_list : expression\n                       | expression COMMA expression_listreadln : READLN LPAREN variable RPARENif_statement : IF expression THEN statement\n                    | IF expression THEN statement ELSE statementwhile_statement : WHILE expression DO statementfor_statement : FOR ID ASSIGN expression TO expression DO statement\n                     | FOR ID ASSIGN expression DOWNTO expression DO statementexpression : simple_expression\n                  | simple_expression EQUAL simple_expression\n                  | simple_expression NE simple_expression\n                  | simple_expression LT simple_expression\n                  | simple_expression LE simple_expression\n                  | simple_expression GT simple_expression\n                  | simple_expression GE simple_expressionsimple_expression : term\n                         | simple_expression PLUS term\n                         | simple_expression MINUS term\n                         | simple_expression OR termterm : factor\n            | term TIMES factor\n            | term DIVIDE factor\n            | term DIV factor\n            | term MOD factor\n            | term AND factorfactor : variable\n              | NUMBER\n              | STRING_LITERAL\n              | TRUE\n              | FALSE\n              | LPAREN expression RPARENempty :'
+_lr_signature = 'AND ARRAY ASSIGN BEGIN BOOLEAN CASE COLON COMMA DIV DIVIDE DO DOT DOTDOT DOWNTO ELSE END EQUAL FALSE FOR FUNCTION GE GT ID IF INTEGER LBRACKET LE LPAREN LT MINUS MOD NE NUMBER OF OR PLUS PROCEDURE PROGRAM RBRACKET READLN REAL RPAREN SEMICOLON STRING STRING_LITERAL THEN TIMES TO TRUE VAR WHILE WRITELNprogram : PROGRAM ID SEMICOLON block DOTblock : block_declarations BEGIN statements ENDblock_declarations : block_declarations block_declaration\n                          | emptyblock_declaration : VAR var_declaration_list\n                         | procedure_declaration\n                         | function_declarationprocedure_declaration : PROCEDURE ID parameters SEMICOLON procedure_block SEMICOLONfunction_declaration : FUNCTION ID parameters COLON type SEMICOLON procedure_block SEMICOLONparameters : LPAREN parameter_list RPAREN\n                  | emptyparameter_list : var_declaration\n                      | var_declaration SEMICOLON parameter_listprocedure_block : declarations BEGIN statements ENDdeclarations : VAR var_declaration_list\n                    | emptyvar_declaration_list : var_declaration SEMICOLON var_declaration_list\n                            | var_declaration SEMICOLONvar_declaration : id_list COLON typeid_list : ID\n               | ID COMMA id_listarray_type : ARRAY LBRACKET index_ranges RBRACKET OF typeindex_ranges : NUMBER DOTDOT NUMBER\n                    | NUMBER DOTDOT NUMBER COMMA index_rangestype : INTEGER\n            | BOOLEAN\n            | STRING\n            | REAL\n            | array_typestatements : statements SEMICOLON statement\n                  | statementstatement : assignment\n                 | writeln\n                 | readln\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | case_statement\n                 | compound_statement\n                 | procedure_call\n                 | emptyprocedure_call : ID\n                      | ID LPAREN expression_list RPARENcompound_statement : BEGIN statements ENDassignment : variable ASSIGN expressionvariable : ID\n                | ID subscriptssubscripts : LBRACKET expression_list RBRACKET\n                  | subscripts LBRACKET expression_list RBRACKETwriteln : WRITELN LPAREN expression_list RPARENexpression_list : expression\n                       | expression COMMA expression_listreadln : READLN LPAREN variable RPARENif_statement : IF expression THEN statement\n                    | IF expression THEN statement ELSE statementwhile_statement : WHILE expression DO statementfor_statement : FOR ID ASSIGN expression TO expression DO statement\n                     | FOR ID ASSIGN expression DOWNTO expression DO statementcase_statement : CASE expression OF case_list END\n                      | CASE expression OF case_list ELSE statements ENDcase_list : case_element\n                 | case_element SEMICOLON case_listcase_element : case_labels COLON statement\n                    | emptycase_labels : case_label\n                   | case_label COMMA case_labelscase_label : NUMBER\n                  | NUMBER DOTDOT NUMBERexpression : simple_expression\n                  | simple_expression EQUAL simple_expression\n                  | simple_expression NE simple_expression\n                  | simple_expression LT simple_expression\n                  | simple_expression LE simple_expression\n                  | simple_expression GT simple_expression\n                  | simple_expression GE simple_expressionsimple_expression : term\n                         | simple_expression PLUS term\n                         | simple_expression MINUS term\n                         | simple_expression OR termterm : factor\n            | term TIMES factor\n            | term DIVIDE factor\n            | term DIV factor\n            | term MOD factor\n            | term AND factorfactor : variable\n              | function_call\n              | NUMBER\n              | STRING_LITERAL\n              | TRUE\n              | FALSE\n              | LPAREN expression RPARENfunction_call : ID LPAREN expression_list RPARENempty :'
     
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,9,],[0,-1,]),'ID':([2,7,13,18,21,23,24,39,40,41,55,56,57,58,68,72,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,98,99,102,105,129,130,131,138,139,],[3,17,20,42,17,17,42,69,69,71,42,69,69,69,69,69,42,69,69,69,69,69,69,69,69,69,69,69,69,69,69,42,69,42,69,42,69,69,42,42,]),'SEMICOLON':([3,15,18,20,24,26,27,28,29,30,31,32,33,34,35,42,45,46,47,48,49,50,55,60,61,62,63,64,65,66,67,69,73,76,78,82,98,102,104,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,129,132,134,138,139,141,142,143,],[4,21,-68,43,-68,55,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-11,-15,-16,-17,-18,-19,-68,-45,-52,-56,-62,-63,-64,-65,-66,-34,101,-32,-33,-68,-68,-68,-36,-39,-40,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-42,-35,-68,-6,-41,-68,-68,-43,-44,-14,]),'VAR':([4,43,],[7,7,]),'PROCEDURE':([4,6,8,11,14,21,44,101,],[-68,13,-8,13,-7,-10,-9,-5,]),'BEGIN':([4,6,8,10,11,12,14,18,19,21,24,43,44,55,74,82,98,101,102,129,138,139,],[-68,-68,-8,18,-68,-4,-7,24,-3,-10,24,-68,-9,24,102,24,24,-5,24,24,24,24,]),'DOT':([5,54,],[9,-2,]),'COLON':([16,17,52,],[22,-12,-13,]),'COMMA':([17,60,61,62,63,64,65,66,67,69,80,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,],[23,-45,-52,-56,-62,-63,-64,-65,-66,-34,105,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'WRITELN':([18,24,55,82,98,102,129,138,139,],[37,37,37,37,37,37,37,37,37,]),'READLN':([18,24,55,82,98,102,129,138,139,],[38,38,38,38,38,38,38,38,38,]),'IF':([18,24,55,82,98,102,129,138,139,],[39,39,39,39,39,39,39,39,39,]),'WHILE':([18,24,55,82,98,102,129,138,139,],[40,40,40,40,40,40,40,40,40,]),'FOR':([18,24,55,82,98,102,129,138,139,],[41,41,41,41,41,41,41,41,41,]),'END':([18,24,25,26,27,28,29,30,31,32,33,34,35,42,53,55,60,61,62,63,64,65,66,67,69,76,77,78,82,98,102,104,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,129,134,138,139,141,142,],[-68,-68,54,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,76,-68,-45,-52,-56,-62,-63,-64,-65,-66,-34,-32,-20,-33,-68,-68,-68,-36,-39,-40,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-42,-35,132,-68,-41,-68,-68,-43,-44,]),'INTEGER':([22,140,],[46,46,]),'BOOLEAN':([22,140,],[47,47,]),'STRING':([22,140,],[48,48,]),'REAL':([22,140,],[49,49,]),'ARRAY':([22,140,],[51,51,]),'ELSE':([27,28,29,30,31,32,33,34,35,42,60,61,62,63,64,65,66,67,69,76,78,82,98,104,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,129,134,138,139,141,142,],[-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-45,-52,-56,-62,-63,-64,-65,-66,-34,-32,-33,-68,-68,-36,-39,129,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-42,-35,-68,-41,-68,-68,-43,-44,]),'ASSIGN':([36,42,71,125,],[56,-34,99,-35,]),'LPAREN':([37,38,39,40,56,57,68,72,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,105,130,131,],[57,58,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'NUMBER':([39,40,56,57,68,72,75,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,105,127,130,131,],[64,64,64,64,64,64,103,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,133,64,64,]),'STRING_LITERAL':([39,40,56,57,68,72,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,105,130,131,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'TRUE':([39,40,56,57,68,72,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,105,130,131,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'FALSE':([39,40,56,57,68,72,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,105,130,131,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'LBRACKET':([42,51,69,],[72,75,72,]),'THEN':([59,60,61,62,63,64,65,66,67,69,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,],[82,-45,-52,-56,-62,-63,-64,-65,-66,-34,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'DO':([60,61,62,63,64,65,66,67,69,70,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,135,136,],[-45,-52,-56,-62,-63,-64,-65,-66,-34,98,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,138,139,]),'RPAREN':([60,61,62,63,64,65,66,67,69,79,80,81,97,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,128,],[-45,-52,-56,-62,-63,-64,-65,-66,-34,104,-37,106,122,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,-38,]),'RBRACKET':([60,61,62,63,64,65,66,67,69,100,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,133,],[-45,-52,-56,-62,-63,-64,-65,-66,-34,125,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,137,]),'TO':([60,61,62,63,64,65,66,67,69,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,124,125,],[-45,-52,-56,-62,-63,-64,-65,-66,-34,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,130,-35,]),'DOWNTO':([60,61,62,63,64,65,66,67,69,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,124,125,],[-45,-52,-56,-62,-63,-64,-65,-66,-34,-46,-47,-48,-49,-50,-51,-53,-54,-55,-57,-58,-59,-60,-61,-67,131,-35,]),'EQUAL':([60,61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[83,-52,-56,-62,-63,-64,-65,-66,-34,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'NE':([60,61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[84,-52,-56,-62,-63,-64,-65,-66,-34,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'LT':([60,61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[85,-52,-56,-62,-63,-64,-65,-66,-34,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'LE':([60,61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[86,-52,-56,-62,-63,-64,-65,-66,-34,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'GT':([60,61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[87,-52,-56,-62,-63,-64,-65,-66,-34,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'GE':([60,61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[88,-52,-56,-62,-63,-64,-65,-66,-34,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'PLUS':([60,61,62,63,64,65,66,67,69,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,],[89,-52,-56,-62,-63,-64,-65,-66,-34,89,89,89,89,89,89,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'MINUS':([60,61,62,63,64,65,66,67,69,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,],[90,-52,-56,-62,-63,-64,-65,-66,-34,90,90,90,90,90,90,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'OR':([60,61,62,63,64,65,66,67,69,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,],[91,-52,-56,-62,-63,-64,-65,-66,-34,91,91,91,91,91,91,-53,-54,-55,-57,-58,-59,-60,-61,-67,-35,]),'TIMES':([61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[92,-56,-62,-63,-64,-65,-66,-34,92,92,92,-57,-58,-59,-60,-61,-67,-35,]),'DIVIDE':([61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[93,-56,-62,-63,-64,-65,-66,-34,93,93,93,-57,-58,-59,-60,-61,-67,-35,]),'DIV':([61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[94,-56,-62,-63,-64,-65,-66,-34,94,94,94,-57,-58,-59,-60,-61,-67,-35,]),'MOD':([61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[95,-56,-62,-63,-64,-65,-66,-34,95,95,95,-57,-58,-59,-60,-61,-67,-35,]),'AND':([61,62,63,64,65,66,67,69,114,115,116,117,118,119,120,121,122,125,],[96,-56,-62,-63,-64,-65,-66,-34,96,96,96,-57,-58,-59,-60,-61,-67,-35,]),'DOTDOT':([103,],[127,]),'OF':([137,],[140,]),}
+_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,8,],[0,-1,]),'ID':([2,9,11,14,15,16,32,33,34,36,45,46,47,48,59,63,65,67,69,71,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,101,118,151,154,157,159,160,163,165,171,187,188,],[3,35,40,41,42,35,60,60,62,60,35,60,60,80,60,60,60,40,40,40,35,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,35,60,60,60,40,40,35,60,60,35,35,35,35,35,]),'SEMICOLON':([3,9,16,17,18,19,20,21,22,23,24,25,26,27,28,35,38,41,43,45,50,51,52,53,54,55,56,57,58,60,64,70,72,74,75,76,81,98,103,105,106,107,108,109,110,115,117,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,139,141,143,145,149,153,155,157,158,161,162,163,164,165,171,175,178,180,185,186,187,188,189,192,194,195,196,],[4,-94,-94,45,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,67,-94,45,-94,-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,113,-11,-44,-30,-45,-94,-94,-94,-19,-25,-26,-27,-28,-29,154,-50,-53,-54,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-56,-43,-48,164,-64,170,-10,174,-94,-93,-49,-59,-94,-94,-94,-94,-55,45,-63,45,193,-94,-94,-60,-14,-57,-58,-22,]),'BEGIN':([4,6,7,9,10,12,13,16,37,45,67,81,98,104,113,150,152,157,163,165,170,171,172,174,187,188,193,],[-94,9,-4,16,-3,-6,-7,16,-5,16,-18,16,16,-17,-94,171,-16,16,16,16,-8,16,-15,-94,16,16,-9,]),'VAR':([4,6,7,10,12,13,37,67,104,113,170,174,193,],[-94,11,-4,-3,-6,-7,-5,-18,-17,151,-8,151,-9,]),'PROCEDURE':([4,6,7,10,12,13,37,67,104,170,193,],[-94,14,-4,-3,-6,-7,-5,-18,-17,-8,-9,]),'FUNCTION':([4,6,7,10,12,13,37,67,104,170,193,],[-94,15,-4,-3,-6,-7,-5,-18,-17,-8,-9,]),'DOT':([5,44,],[8,-2,]),'WRITELN':([9,16,45,81,98,157,163,165,171,187,188,],[30,30,30,30,30,30,30,30,30,30,30,]),'READLN':([9,16,45,81,98,157,163,165,171,187,188,],[31,31,31,31,31,31,31,31,31,31,31,]),'IF':([9,16,45,81,98,157,163,165,171,187,188,],[32,32,32,32,32,32,32,32,32,32,32,]),'WHILE':([9,16,45,81,98,157,163,165,171,187,188,],[33,33,33,33,33,33,33,33,33,33,33,]),'FOR':([9,16,45,81,98,157,163,165,171,187,188,],[34,34,34,34,34,34,34,34,34,34,34,]),'CASE':([9,16,45,81,98,157,163,165,171,187,188,],[36,36,36,36,36,36,36,36,36,36,36,]),'END':([9,16,17,18,19,20,21,22,23,24,25,26,27,28,35,43,45,50,51,52,53,54,55,56,57,58,60,64,74,75,76,81,98,103,117,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,139,141,142,143,145,157,158,161,162,163,164,165,171,175,178,179,180,185,187,188,189,194,195,],[-94,-94,44,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,74,-94,-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-44,-30,-45,-94,-94,-94,-50,-53,-54,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-56,-43,-48,162,-61,-64,-94,-93,-49,-59,-94,-94,-94,-94,-55,189,-62,-63,192,-94,-94,-60,-57,-58,]),'ELSE':([19,20,21,22,23,24,25,26,27,28,35,50,51,52,53,54,55,56,57,58,60,64,74,76,81,98,103,117,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,139,141,142,143,145,157,158,161,162,164,165,175,179,180,187,188,189,194,195,],[-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-44,-45,-94,-94,-94,-50,-53,157,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-56,-43,-48,163,-61,-64,-94,-93,-49,-59,-94,-94,-55,-62,-63,-94,-94,-60,-57,-58,]),'ASSIGN':([29,35,62,64,141,161,],[46,-46,99,-47,-48,-49,]),'LPAREN':([30,31,32,33,35,36,41,42,46,47,59,60,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,118,159,160,],[47,48,59,59,63,59,71,71,59,59,59,97,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'NUMBER':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,103,118,148,159,160,164,166,167,184,197,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,147,55,169,55,55,147,147,182,191,169,]),'STRING_LITERAL':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,118,159,160,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'TRUE':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,118,159,160,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'FALSE':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,118,159,160,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'LBRACKET':([35,60,64,80,111,141,161,],[65,65,101,65,148,-48,-49,]),'COLON':([39,40,42,72,73,112,144,146,147,153,181,182,],[68,-20,-94,-11,116,-21,165,-65,-67,-10,-66,-68,]),'COMMA':([40,50,51,52,53,54,55,56,57,58,60,64,78,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,146,147,158,161,182,191,],[69,-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,118,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,166,-67,-93,-49,-68,197,]),'THEN':([49,50,51,52,53,54,55,56,57,58,60,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,158,161,],[81,-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'DO':([50,51,52,53,54,55,56,57,58,60,61,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,158,161,176,177,],[-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,98,-47,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,187,188,]),'OF':([50,51,52,53,54,55,56,57,58,60,64,66,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,158,161,183,],[-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,103,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,190,]),'RPAREN':([50,51,52,53,54,55,56,57,58,60,64,77,78,79,80,96,100,105,106,107,108,109,110,114,115,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,141,156,158,161,173,196,],[-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,117,-51,119,-46,135,139,-19,-25,-26,-27,-28,-29,153,-12,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,158,-48,-52,-93,-49,-13,-22,]),'RBRACKET':([50,51,52,53,54,55,56,57,58,60,64,78,102,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,140,141,156,158,161,168,191,198,],[-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-51,141,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,161,-48,-52,-93,-49,183,-23,-24,]),'TO':([50,51,52,53,54,55,56,57,58,60,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,158,161,],[-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,159,-48,-93,-49,]),'DOWNTO':([50,51,52,53,54,55,56,57,58,60,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,141,158,161,],[-69,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-70,-71,-72,-73,-74,-75,-77,-78,-79,-81,-82,-83,-84,-85,-92,160,-48,-93,-49,]),'EQUAL':([50,51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[82,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'NE':([50,51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[83,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'LT':([50,51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[84,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'LE':([50,51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[85,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'GT':([50,51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[86,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'GE':([50,51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[87,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'PLUS':([50,51,52,53,54,55,56,57,58,60,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,158,161,],[88,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,88,88,88,88,88,88,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'MINUS':([50,51,52,53,54,55,56,57,58,60,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,158,161,],[89,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,89,89,89,89,89,89,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'OR':([50,51,52,53,54,55,56,57,58,60,64,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,141,158,161,],[90,-76,-80,-86,-87,-88,-89,-90,-91,-46,-47,90,90,90,90,90,90,-77,-78,-79,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'TIMES':([51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[91,-80,-86,-87,-88,-89,-90,-91,-46,-47,91,91,91,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'DIVIDE':([51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[92,-80,-86,-87,-88,-89,-90,-91,-46,-47,92,92,92,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'DIV':([51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[93,-80,-86,-87,-88,-89,-90,-91,-46,-47,93,93,93,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'MOD':([51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[94,-80,-86,-87,-88,-89,-90,-91,-46,-47,94,94,94,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'AND':([51,52,53,54,55,56,57,58,60,64,127,128,129,130,131,132,133,134,135,141,158,161,],[95,-80,-86,-87,-88,-89,-90,-91,-46,-47,95,95,95,-81,-82,-83,-84,-85,-92,-48,-93,-49,]),'INTEGER':([68,116,190,],[106,106,106,]),'BOOLEAN':([68,116,190,],[107,107,107,]),'STRING':([68,116,190,],[108,108,108,]),'REAL':([68,116,190,],[109,109,109,]),'ARRAY':([68,116,190,],[111,111,111,]),'DOTDOT':([147,169,],[167,184,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'block':([4,],[5,]),'declarations':([4,43,],[6,74,]),'empty':([4,6,11,18,24,43,55,82,98,102,129,138,139,],[8,12,12,35,35,8,35,35,35,35,35,35,35,]),'procedures':([6,11,],[10,19,]),'procedure_declaration':([6,11,],[11,11,]),'var_declaration_list':([7,21,],[14,44,]),'var_declaration':([7,21,],[15,15,]),'id_list':([7,21,23,],[16,16,52,]),'statements':([18,24,55,102,],[25,53,77,126,]),'statement':([18,24,55,82,98,102,129,138,139,],[26,26,26,107,123,26,134,141,142,]),'assignment':([18,24,55,82,98,102,129,138,139,],[27,27,27,27,27,27,27,27,27,]),'writeln':([18,24,55,82,98,102,129,138,139,],[28,28,28,28,28,28,28,28,28,]),'readln':([18,24,55,82,98,102,129,138,139,],[29,29,29,29,29,29,29,29,29,]),'if_statement':([18,24,55,82,98,102,129,138,139,],[30,30,30,30,30,30,30,30,30,]),'while_statement':([18,24,55,82,98,102,129,138,139,],[31,31,31,31,31,31,31,31,31,]),'for_statement':([18,24,55,82,98,102,129,138,139,],[32,32,32,32,32,32,32,32,32,]),'compound_statement':([18,24,55,82,98,102,129,138,139,],[33,33,33,33,33,33,33,33,33,]),'procedure_call':([18,24,55,82,98,102,129,138,139,],[34,34,34,34,34,34,34,34,34,]),'variable':([18,24,39,40,55,56,57,58,68,72,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,98,99,102,105,129,130,131,138,139,],[36,36,63,63,36,63,63,81,63,63,36,63,63,63,63,63,63,63,63,63,63,63,63,63,63,36,63,36,63,36,63,63,36,36,]),'type':([22,140,],[45,143,]),'array_type':([22,140,],[50,50,]),'expression':([39,40,56,57,68,72,99,105,130,131,],[59,70,78,80,97,100,124,80,135,136,]),'simple_expression':([39,40,56,57,68,72,83,84,85,86,87,88,99,105,130,131,],[60,60,60,60,60,60,108,109,110,111,112,113,60,60,60,60,]),'term':([39,40,56,57,68,72,83,84,85,86,87,88,89,90,91,99,105,130,131,],[61,61,61,61,61,61,61,61,61,61,61,61,114,115,116,61,61,61,61,]),'factor':([39,40,56,57,68,72,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,105,130,131,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,117,118,119,120,121,62,62,62,62,]),'procedure_block':([43,],[73,]),'expression_list':([57,105,],[79,128,]),}
+_lr_goto_items = {'program':([0,],[1,]),'block':([4,],[5,]),'block_declarations':([4,],[6,]),'empty':([4,9,16,41,42,45,81,98,103,113,157,163,164,165,171,174,187,188,],[7,28,28,72,72,28,28,28,145,152,28,28,145,28,28,152,28,28,]),'block_declaration':([6,],[10,]),'procedure_declaration':([6,],[12,]),'function_declaration':([6,],[13,]),'statements':([9,16,163,171,],[17,43,178,185,]),'statement':([9,16,45,81,98,157,163,165,171,187,188,],[18,18,75,120,137,175,18,180,18,194,195,]),'assignment':([9,16,45,81,98,157,163,165,171,187,188,],[19,19,19,19,19,19,19,19,19,19,19,]),'writeln':([9,16,45,81,98,157,163,165,171,187,188,],[20,20,20,20,20,20,20,20,20,20,20,]),'readln':([9,16,45,81,98,157,163,165,171,187,188,],[21,21,21,21,21,21,21,21,21,21,21,]),'if_statement':([9,16,45,81,98,157,163,165,171,187,188,],[22,22,22,22,22,22,22,22,22,22,22,]),'while_statement':([9,16,45,81,98,157,163,165,171,187,188,],[23,23,23,23,23,23,23,23,23,23,23,]),'for_statement':([9,16,45,81,98,157,163,165,171,187,188,],[24,24,24,24,24,24,24,24,24,24,24,]),'case_statement':([9,16,45,81,98,157,163,165,171,187,188,],[25,25,25,25,25,25,25,25,25,25,25,]),'compound_statement':([9,16,45,81,98,157,163,165,171,187,188,],[26,26,26,26,26,26,26,26,26,26,26,]),'procedure_call':([9,16,45,81,98,157,163,165,171,187,188,],[27,27,27,27,27,27,27,27,27,27,27,]),'variable':([9,16,32,33,36,45,46,47,48,59,63,65,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,101,118,157,159,160,163,165,171,187,188,],[29,29,53,53,53,29,53,53,79,53,53,53,29,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,29,53,53,53,29,53,53,29,29,29,29,29,]),'var_declaration_list':([11,67,151,],[37,104,172,]),'var_declaration':([11,67,71,151,154,],[38,38,115,38,115,]),'id_list':([11,67,69,71,151,154,],[39,39,112,39,39,39,]),'expression':([32,33,36,46,47,59,63,65,97,99,101,118,159,160,],[49,61,66,76,78,96,78,78,78,138,78,78,176,177,]),'simple_expression':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,97,99,101,118,159,160,],[50,50,50,50,50,50,50,50,121,122,123,124,125,126,50,50,50,50,50,50,]),'term':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,97,99,101,118,159,160,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,127,128,129,51,51,51,51,51,51,]),'factor':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,118,159,160,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,130,131,132,133,134,52,52,52,52,52,52,]),'function_call':([32,33,36,46,47,59,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,99,101,118,159,160,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'subscripts':([35,60,80,],[64,64,64,]),'parameters':([41,42,],[70,73,]),'expression_list':([47,63,65,97,101,118,],[77,100,102,136,140,156,]),'type':([68,116,190,],[105,155,196,]),'array_type':([68,116,190,],[110,110,110,]),'parameter_list':([71,154,],[114,173,]),'case_list':([103,164,],[142,179,]),'case_element':([103,164,],[143,143,]),'case_labels':([103,164,166,],[144,144,181,]),'case_label':([103,164,166,],[146,146,146,]),'procedure_block':([113,174,],[149,186,]),'declarations':([113,174,],[150,150,]),'index_ranges':([148,197,],[168,198,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,72 +27,98 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> PROGRAM ID SEMICOLON block DOT','program',5,'p_program','parser.py',345),
-  ('block -> declarations procedures BEGIN statements END','block',5,'p_block','parser.py',350),
-  ('procedures -> procedure_declaration procedures','procedures',2,'p_procedures','parser.py',361),
-  ('procedures -> empty','procedures',1,'p_procedures','parser.py',362),
-  ('procedure_declaration -> PROCEDURE ID SEMICOLON procedure_block SEMICOLON','procedure_declaration',5,'p_procedure_declaration','parser.py',369),
-  ('procedure_block -> declarations BEGIN statements END','procedure_block',4,'p_procedure_block','parser.py',394),
-  ('declarations -> VAR var_declaration_list','declarations',2,'p_declarations','parser.py',399),
-  ('declarations -> empty','declarations',1,'p_declarations','parser.py',400),
-  ('var_declaration_list -> var_declaration SEMICOLON var_declaration_list','var_declaration_list',3,'p_var_declaration_list','parser.py',404),
-  ('var_declaration_list -> var_declaration SEMICOLON','var_declaration_list',2,'p_var_declaration_list','parser.py',405),
-  ('var_declaration -> id_list COLON type','var_declaration',3,'p_var_declaration','parser.py',412),
-  ('id_list -> ID','id_list',1,'p_id_list','parser.py',438),
-  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list','parser.py',439),
-  ('array_type -> ARRAY LBRACKET NUMBER DOTDOT NUMBER RBRACKET OF type','array_type',8,'p_array_type','parser.py',446),
-  ('type -> INTEGER','type',1,'p_type','parser.py',455),
-  ('type -> BOOLEAN','type',1,'p_type','parser.py',456),
-  ('type -> STRING','type',1,'p_type','parser.py',457),
-  ('type -> REAL','type',1,'p_type','parser.py',458),
-  ('type -> array_type','type',1,'p_type','parser.py',459),
-  ('statements -> statement SEMICOLON statements','statements',3,'p_statements','parser.py',464),
-  ('statements -> statement','statements',1,'p_statements','parser.py',465),
-  ('statement -> assignment','statement',1,'p_statement','parser.py',473),
-  ('statement -> writeln','statement',1,'p_statement','parser.py',474),
-  ('statement -> readln','statement',1,'p_statement','parser.py',475),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',476),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',477),
-  ('statement -> for_statement','statement',1,'p_statement','parser.py',478),
-  ('statement -> compound_statement','statement',1,'p_statement','parser.py',479),
-  ('statement -> procedure_call','statement',1,'p_statement','parser.py',480),
-  ('statement -> empty','statement',1,'p_statement','parser.py',481),
-  ('procedure_call -> ID','procedure_call',1,'p_procedure_call','parser.py',486),
-  ('compound_statement -> BEGIN statements END','compound_statement',3,'p_compound_statement','parser.py',493),
-  ('assignment -> variable ASSIGN expression','assignment',3,'p_assignment','parser.py',498),
-  ('variable -> ID','variable',1,'p_variable','parser.py',503),
-  ('variable -> ID LBRACKET expression RBRACKET','variable',4,'p_variable','parser.py',504),
-  ('writeln -> WRITELN LPAREN expression_list RPAREN','writeln',4,'p_writeln','parser.py',521),
-  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',525),
-  ('expression_list -> expression COMMA expression_list','expression_list',3,'p_expression_list','parser.py',526),
-  ('readln -> READLN LPAREN variable RPAREN','readln',4,'p_readln','parser.py',534),
-  ('if_statement -> IF expression THEN statement','if_statement',4,'p_if_statement','parser.py',539),
-  ('if_statement -> IF expression THEN statement ELSE statement','if_statement',6,'p_if_statement','parser.py',540),
-  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','parser.py',548),
-  ('for_statement -> FOR ID ASSIGN expression TO expression DO statement','for_statement',8,'p_for_statement','parser.py',553),
-  ('for_statement -> FOR ID ASSIGN expression DOWNTO expression DO statement','for_statement',8,'p_for_statement','parser.py',554),
-  ('expression -> simple_expression','expression',1,'p_expression','parser.py',562),
-  ('expression -> simple_expression EQUAL simple_expression','expression',3,'p_expression','parser.py',563),
-  ('expression -> simple_expression NE simple_expression','expression',3,'p_expression','parser.py',564),
-  ('expression -> simple_expression LT simple_expression','expression',3,'p_expression','parser.py',565),
-  ('expression -> simple_expression LE simple_expression','expression',3,'p_expression','parser.py',566),
-  ('expression -> simple_expression GT simple_expression','expression',3,'p_expression','parser.py',567),
-  ('expression -> simple_expression GE simple_expression','expression',3,'p_expression','parser.py',568),
-  ('simple_expression -> term','simple_expression',1,'p_simple_expression','parser.py',575),
-  ('simple_expression -> simple_expression PLUS term','simple_expression',3,'p_simple_expression','parser.py',576),
-  ('simple_expression -> simple_expression MINUS term','simple_expression',3,'p_simple_expression','parser.py',577),
-  ('simple_expression -> simple_expression OR term','simple_expression',3,'p_simple_expression','parser.py',578),
-  ('term -> factor','term',1,'p_term','parser.py',585),
-  ('term -> term TIMES factor','term',3,'p_term','parser.py',586),
-  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',587),
-  ('term -> term DIV factor','term',3,'p_term','parser.py',588),
-  ('term -> term MOD factor','term',3,'p_term','parser.py',589),
-  ('term -> term AND factor','term',3,'p_term','parser.py',590),
-  ('factor -> variable','factor',1,'p_factor','parser.py',597),
-  ('factor -> NUMBER','factor',1,'p_factor','parser.py',598),
-  ('factor -> STRING_LITERAL','factor',1,'p_factor','parser.py',599),
-  ('factor -> TRUE','factor',1,'p_factor','parser.py',600),
-  ('factor -> FALSE','factor',1,'p_factor','parser.py',601),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',602),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',621),
+  ('program -> PROGRAM ID SEMICOLON block DOT','program',5,'p_program','parser.py',10),
+  ('block -> block_declarations BEGIN statements END','block',4,'p_block','parser.py',17),
+  ('block_declarations -> block_declarations block_declaration','block_declarations',2,'p_block_declarations','parser.py',24),
+  ('block_declarations -> empty','block_declarations',1,'p_block_declarations','parser.py',25),
+  ('block_declaration -> VAR var_declaration_list','block_declaration',2,'p_block_declaration','parser.py',33),
+  ('block_declaration -> procedure_declaration','block_declaration',1,'p_block_declaration','parser.py',34),
+  ('block_declaration -> function_declaration','block_declaration',1,'p_block_declaration','parser.py',35),
+  ('procedure_declaration -> PROCEDURE ID parameters SEMICOLON procedure_block SEMICOLON','procedure_declaration',6,'p_procedure_declaration','parser.py',41),
+  ('function_declaration -> FUNCTION ID parameters COLON type SEMICOLON procedure_block SEMICOLON','function_declaration',8,'p_function_declaration','parser.py',46),
+  ('parameters -> LPAREN parameter_list RPAREN','parameters',3,'p_parameters','parser.py',52),
+  ('parameters -> empty','parameters',1,'p_parameters','parser.py',53),
+  ('parameter_list -> var_declaration','parameter_list',1,'p_parameter_list','parser.py',58),
+  ('parameter_list -> var_declaration SEMICOLON parameter_list','parameter_list',3,'p_parameter_list','parser.py',59),
+  ('procedure_block -> declarations BEGIN statements END','procedure_block',4,'p_procedure_block','parser.py',67),
+  ('declarations -> VAR var_declaration_list','declarations',2,'p_declarations','parser.py',73),
+  ('declarations -> empty','declarations',1,'p_declarations','parser.py',74),
+  ('var_declaration_list -> var_declaration SEMICOLON var_declaration_list','var_declaration_list',3,'p_var_declaration_list','parser.py',79),
+  ('var_declaration_list -> var_declaration SEMICOLON','var_declaration_list',2,'p_var_declaration_list','parser.py',80),
+  ('var_declaration -> id_list COLON type','var_declaration',3,'p_var_declaration','parser.py',88),
+  ('id_list -> ID','id_list',1,'p_id_list','parser.py',93),
+  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list','parser.py',94),
+  ('array_type -> ARRAY LBRACKET index_ranges RBRACKET OF type','array_type',6,'p_array_type','parser.py',103),
+  ('index_ranges -> NUMBER DOTDOT NUMBER','index_ranges',3,'p_index_ranges','parser.py',111),
+  ('index_ranges -> NUMBER DOTDOT NUMBER COMMA index_ranges','index_ranges',5,'p_index_ranges','parser.py',112),
+  ('type -> INTEGER','type',1,'p_type','parser.py',120),
+  ('type -> BOOLEAN','type',1,'p_type','parser.py',121),
+  ('type -> STRING','type',1,'p_type','parser.py',122),
+  ('type -> REAL','type',1,'p_type','parser.py',123),
+  ('type -> array_type','type',1,'p_type','parser.py',124),
+  ('statements -> statements SEMICOLON statement','statements',3,'p_statements','parser.py',133),
+  ('statements -> statement','statements',1,'p_statements','parser.py',134),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',144),
+  ('statement -> writeln','statement',1,'p_statement','parser.py',145),
+  ('statement -> readln','statement',1,'p_statement','parser.py',146),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',147),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',148),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',149),
+  ('statement -> case_statement','statement',1,'p_statement','parser.py',150),
+  ('statement -> compound_statement','statement',1,'p_statement','parser.py',151),
+  ('statement -> procedure_call','statement',1,'p_statement','parser.py',152),
+  ('statement -> empty','statement',1,'p_statement','parser.py',153),
+  ('procedure_call -> ID','procedure_call',1,'p_procedure_call','parser.py',159),
+  ('procedure_call -> ID LPAREN expression_list RPAREN','procedure_call',4,'p_procedure_call','parser.py',160),
+  ('compound_statement -> BEGIN statements END','compound_statement',3,'p_compound_statement','parser.py',169),
+  ('assignment -> variable ASSIGN expression','assignment',3,'p_assignment','parser.py',175),
+  ('variable -> ID','variable',1,'p_variable','parser.py',181),
+  ('variable -> ID subscripts','variable',2,'p_variable','parser.py',182),
+  ('subscripts -> LBRACKET expression_list RBRACKET','subscripts',3,'p_subscripts','parser.py',192),
+  ('subscripts -> subscripts LBRACKET expression_list RBRACKET','subscripts',4,'p_subscripts','parser.py',193),
+  ('writeln -> WRITELN LPAREN expression_list RPAREN','writeln',4,'p_writeln','parser.py',202),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',207),
+  ('expression_list -> expression COMMA expression_list','expression_list',3,'p_expression_list','parser.py',208),
+  ('readln -> READLN LPAREN variable RPAREN','readln',4,'p_readln','parser.py',217),
+  ('if_statement -> IF expression THEN statement','if_statement',4,'p_if_statement','parser.py',223),
+  ('if_statement -> IF expression THEN statement ELSE statement','if_statement',6,'p_if_statement','parser.py',224),
+  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','parser.py',233),
+  ('for_statement -> FOR ID ASSIGN expression TO expression DO statement','for_statement',8,'p_for_statement','parser.py',239),
+  ('for_statement -> FOR ID ASSIGN expression DOWNTO expression DO statement','for_statement',8,'p_for_statement','parser.py',240),
+  ('case_statement -> CASE expression OF case_list END','case_statement',5,'p_case_statement','parser.py',249),
+  ('case_statement -> CASE expression OF case_list ELSE statements END','case_statement',7,'p_case_statement','parser.py',250),
+  ('case_list -> case_element','case_list',1,'p_case_list','parser.py',259),
+  ('case_list -> case_element SEMICOLON case_list','case_list',3,'p_case_list','parser.py',260),
+  ('case_element -> case_labels COLON statement','case_element',3,'p_case_element','parser.py',268),
+  ('case_element -> empty','case_element',1,'p_case_element','parser.py',269),
+  ('case_labels -> case_label','case_labels',1,'p_case_labels','parser.py',278),
+  ('case_labels -> case_label COMMA case_labels','case_labels',3,'p_case_labels','parser.py',279),
+  ('case_label -> NUMBER','case_label',1,'p_case_label','parser.py',287),
+  ('case_label -> NUMBER DOTDOT NUMBER','case_label',3,'p_case_label','parser.py',288),
+  ('expression -> simple_expression','expression',1,'p_expression','parser.py',297),
+  ('expression -> simple_expression EQUAL simple_expression','expression',3,'p_expression','parser.py',298),
+  ('expression -> simple_expression NE simple_expression','expression',3,'p_expression','parser.py',299),
+  ('expression -> simple_expression LT simple_expression','expression',3,'p_expression','parser.py',300),
+  ('expression -> simple_expression LE simple_expression','expression',3,'p_expression','parser.py',301),
+  ('expression -> simple_expression GT simple_expression','expression',3,'p_expression','parser.py',302),
+  ('expression -> simple_expression GE simple_expression','expression',3,'p_expression','parser.py',303),
+  ('simple_expression -> term','simple_expression',1,'p_simple_expression','parser.py',311),
+  ('simple_expression -> simple_expression PLUS term','simple_expression',3,'p_simple_expression','parser.py',312),
+  ('simple_expression -> simple_expression MINUS term','simple_expression',3,'p_simple_expression','parser.py',313),
+  ('simple_expression -> simple_expression OR term','simple_expression',3,'p_simple_expression','parser.py',314),
+  ('term -> factor','term',1,'p_term','parser.py',322),
+  ('term -> term TIMES factor','term',3,'p_term','parser.py',323),
+  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',324),
+  ('term -> term DIV factor','term',3,'p_term','parser.py',325),
+  ('term -> term MOD factor','term',3,'p_term','parser.py',326),
+  ('term -> term AND factor','term',3,'p_term','parser.py',327),
+  ('factor -> variable','factor',1,'p_factor','parser.py',335),
+  ('factor -> function_call','factor',1,'p_factor','parser.py',336),
+  ('factor -> NUMBER','factor',1,'p_factor','parser.py',337),
+  ('factor -> STRING_LITERAL','factor',1,'p_factor','parser.py',338),
+  ('factor -> TRUE','factor',1,'p_factor','parser.py',339),
+  ('factor -> FALSE','factor',1,'p_factor','parser.py',340),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',341),
+  ('function_call -> ID LPAREN expression_list RPAREN','function_call',4,'p_function_call','parser.py',360),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',366),
 ]
@@ -0,0 +1,469 @@
+import argparse
+import array
+import mmap
+import struct
+import sys
+import time
+
+# Instruções suportadas. A posição na lista é o código numérico da instrução
+# e o índice do método que a executa na tabela de despacho
+OPCODES = [
+    'STOP', 'PUSHN', 'PUSHI', 'PUSHF', 'PUSHS', 'PUSHG', 'STOREG', 'LOADN', 'STOREN', 'DUP',
+    'READ', 'ATOI', 'ATOF', 'WRITES', 'WRITEI', 'WRITEF', 'WRITELN',
+    'ADD', 'SUB', 'MUL', 'DIV', 'MOD', 'FADD', 'FSUB', 'FMUL', 'FDIV',
+    'EQUAL', 'NOT', 'AND', 'OR', 'INF', 'INFEQ', 'SUP', 'SUPEQ',
+    'FINF', 'FINFEQ', 'FSUP', 'FSUPEQ',
+    'JUMP', 'JZ', 'PUSHA', 'CALL', 'RETURN', 'ERR',
+    'SWAP', 'ALLOC', 'PADD', 'LOAD', 'STORE',
+    'PUSHL', 'STOREL', 'POP',
+]
+OPCODE = {name: code for code, name in enumerate(OPCODES)}
+
+# Tipo do operando de cada instrução (as restantes não têm operando)
+OPERAND_KIND = {
+    'PUSHN': 'int',
+    'PUSHI': 'int',
+    'PUSHG': 'int',
+    'STOREG': 'int',
+    'DUP': 'int',
+    'PUSHL': 'int',
+    'STOREL': 'int',
+    'POP': 'int',
+    'ALLOC': 'int',
+    'LOAD': 'int',
+    'STORE': 'int',
+    'PUSHF': 'float',
+    'PUSHS': 'string',
+    'ERR': 'string',
+    'JUMP': 'label',
+    'JZ': 'label',
+    'PUSHA': 'label',
+}
+
+
+# Bytecode binário: cabeçalho (assinatura, versão, número de instruções e de
+# constantes), os operandos (int64 little-endian), os opcodes (um byte cada)
+# e as constantes (b'f' e um double, ou b's', o tamanho e a string em UTF-8).
+# Os operandos vêm logo a seguir ao cabeçalho de 16 bytes, alinhados a 8
+BYTECODE_MAGIC = b'EWVB'
+BYTECODE_VERSION = 1
+BYTECODE_HEADER = struct.Struct('<4sHHII')
+BYTECODE_FLOAT = struct.Struct('<d')
+BYTECODE_LENGTH = struct.Struct('<I')
+
+
+class VMError(Exception):
+    pass
+
+
+# Programa descodificado: opcodes e operandos em arrays compactos, com os
+# rótulos já resolvidos para o índice da instrução. Os operandos que não são
+# inteiros (reais e strings) ficam numa tabela de constantes indexada pelo operando
+class Program:
+    def __init__(self, opcodes, operands, constants, labels):
+        self.opcodes = opcodes
+        self.operands = operands
+        self.constants = constants
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def run(self, stdin=None, stdout=None):
+        return Machine(self, stdin, stdout).run()
+
+    # Texto pré-ligado: sem rótulos, com os destinos dos saltos (e os
+    # endereços do PUSHA) como índices de instruções
+    def text(self):
+        constants = self.constants
+        lines = []
+        for opcode, operand in zip(self.opcodes, self.operands):
+            name = OPCODES[opcode]
+            kind = OPERAND_KIND.get(name)
+            if kind is None:
+                lines.append(name)
+            elif kind == 'string':
+                lines.append(f'{name} "{constants[operand]}"')
+            elif kind == 'float':
+                lines.append(f"{name} {constants[operand]}")
+            else:
+                lines.append(f"{name} {operand}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def to_bytes(self):
+        operands = array.array('q', self.operands)
+        if sys.byteorder == 'big':
+            operands.byteswap()
+        parts = [BYTECODE_HEADER.pack(BYTECODE_MAGIC, BYTECODE_VERSION, 0, len(self.opcodes), len(self.constants)),
+                 operands.tobytes(), bytes(self.opcodes)]
+        for value in self.constants:
+            if isinstance(value, float):
+                parts.append(b'f' + BYTECODE_FLOAT.pack(value))
+            else:
+                data = value.encode('utf-8')
+                parts.append(b's' + BYTECODE_LENGTH.pack(len(data)) + data)
+        return b"".join(parts)
+
+
+# Função para descodificar o código VM (texto ou lista de linhas) num Program.
+# Os destinos dos saltos podem ser rótulos ou já índices de instruções (texto pré-ligado)
+def load(code):
+    if isinstance(code, str):
+        code = code.splitlines()
+
+    # Primeira passagem: separar rótulos de instruções
+    labels = {}
+    instructions = []
+    for line_number, line in enumerate(code, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.endswith(':'):
+            labels[line[:-1]] = len(instructions)
+            continue
+        name, _, operand = line.partition(' ')
+        name = name.upper()
+        if name not in OPCODE:
+            raise VMError(f"Instrução desconhecida '{name}', linha {line_number}")
+        instructions.append((name, operand.strip(), line_number))
+
+    # Segunda passagem: codificar cada instrução num par (opcode, operando)
+    opcodes = array.array('B')
+    operands = array.array('q')
+    constants = []
+    for name, operand, line_number in instructions:
+        kind = OPERAND_KIND.get(name)
+        if kind is None:
+            value = 0
+        elif kind == 'int':
+            value = int(operand)
+        elif kind == 'label':
+            if operand in labels:
+                value = labels[operand]
+            elif operand.isdigit():
+                value = int(operand)
+            else:
+                raise VMError(f"Rótulo '{operand}' não definido, linha {line_number}")
+        else:
+            if kind == 'float':
+                constants.append(float(operand))
+            else:
+                constants.append(operand[1:-1] if operand.startswith('"') else operand)
+            value = len(constants) - 1
+        opcodes.append(OPCODE[name])
+        operands.append(value)
+    return Program(opcodes, operands, constants, labels)
+
+
+# Program a partir de bytecode (bytes ou um mmap do ficheiro). Os opcodes e
+# os operandos não são copiados: são vistas (memoryview) sobre os dados
+def load_bytecode(data):
+    view = memoryview(data)
+    if len(view) < BYTECODE_HEADER.size:
+        raise VMError("Bytecode truncado")
+    magic, version, _, count, constant_count = BYTECODE_HEADER.unpack_from(view)
+    if magic != BYTECODE_MAGIC or version != BYTECODE_VERSION:
+        raise VMError("Bytecode com formato ou versão desconhecidos")
+    offset = BYTECODE_HEADER.size
+    if len(view) < offset + 9 * count:
+        raise VMError("Bytecode truncado")
+    operands = view[offset:offset + 8 * count].cast('q')
+    if sys.byteorder == 'big':
+        operands = array.array('q', operands.tobytes())
+        operands.byteswap()
+    offset += 8 * count
+    opcodes = view[offset:offset + count]
+    offset += count
+
+    constants = []
+    try:
+        for _ in range(constant_count):
+            kind = view[offset]
+            offset += 1
+            if kind == ord('f'):
+                constants.append(BYTECODE_FLOAT.unpack_from(view, offset)[0])
+                offset += BYTECODE_FLOAT.size
+            else:
+                length = BYTECODE_LENGTH.unpack_from(view, offset)[0]
+                offset += BYTECODE_LENGTH.size
+                constants.append(bytes(view[offset:offset + length]).decode('utf-8'))
+                offset += length
+    except (IndexError, struct.error):
+        raise VMError("Bytecode truncado") from None
+    return Program(opcodes, operands, constants, {})
+
+
+# Carrega um ficheiro de código VM: bytecode (reconhecido pela assinatura,
+# lido com mmap) ou texto EWVM, com rótulos ou pré-ligado
+def load_file(path):
+    with open(path, 'rb') as f:
+        if f.read(len(BYTECODE_MAGIC)) == BYTECODE_MAGIC:
+            return load_bytecode(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        f.seek(0)
+        return load(f.read().decode('utf-8'))
+
+
+# Divisão e resto inteiros com truncagem para zero, como na EWVM
+def int_div(a, b):
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def int_mod(a, b):
+    return a - b * int_div(a, b)
+
+
+# Máquina virtual: as variáveis globais ocupam o início da pilha (gp = 0),
+# tal como na EWVM, por isso PUSHN reserva espaço e PUSHG/STOREG acedem-lhe diretamente
+class Machine:
+    def __init__(self, program, stdin=None, stdout=None):
+        self.program = program
+        self.stdin = stdin if stdin is not None else sys.stdin
+        self.stdout = stdout if stdout is not None else sys.stdout
+        self.stack = []
+        self.heap = []  # Blocos do ALLOC, seguidos; um endereço da heap é um índice nesta lista
+        self.call_stack = []
+        self.fp = 0
+        self.pc = 0
+        self.running = False
+        self.dispatch = [getattr(self, 'op_' + name.lower()) for name in OPCODES]
+
+    # Executa o programa até STOP ou até ao fim do código; devolve o número de instruções executadas
+    def run(self):
+        opcodes = self.program.opcodes
+        operands = self.program.operands
+        dispatch = self.dispatch
+        end = len(opcodes)
+        steps = 0
+        self.running = True
+        while self.running and self.pc < end:
+            pc = self.pc
+            self.pc = pc + 1
+            try:
+                dispatch[opcodes[pc]](operands[pc])
+            except IndexError:
+                raise VMError(f"Acesso fora da pilha em {OPCODES[opcodes[pc]]}, instrução {pc}") from None
+            except (TypeError, ValueError) as error:
+                raise VMError(f"Erro em {OPCODES[opcodes[pc]]}, instrução {pc}: {error}") from None
+            steps += 1
+        self.running = False
+        return steps
+
+    # Aplica uma operação binária aos dois valores no topo da pilha
+    def binary(self, operation):
+        stack = self.stack
+        b = stack.pop()
+        stack[-1] = operation(stack[-1], b)
+
+    def op_stop(self, arg):
+        self.running = False
+
+    # Pilha e variáveis globais
+    def op_pushn(self, arg):
+        self.stack.extend([0] * arg)
+
+    def op_pushi(self, arg):
+        self.stack.append(arg)
+
+    def op_pushf(self, arg):
+        self.stack.append(self.program.constants[arg])
+
+    def op_pushs(self, arg):
+        self.stack.append(self.program.constants[arg])
+
+    def op_pushg(self, arg):
+        self.stack.append(self.stack[arg])
+
+    def op_storeg(self, arg):
+        value = self.stack.pop()
+        self.stack[arg] = value
+
+    # Variáveis locais e parâmetros, relativos ao FP da chamada atual
+    def op_pushl(self, arg):
+        self.stack.append(self.stack[self.fp + arg])
+
+    def op_storel(self, arg):
+        value = self.stack.pop()
+        self.stack[self.fp + arg] = value
+
+    def op_pop(self, arg):
+        del self.stack[len(self.stack) - arg:]
+
+    def op_dup(self, arg):
+        self.stack.extend(self.stack[-arg:])
+
+    # O compilador calcula o endereço global do elemento e deixa-o no topo da pilha
+    def op_loadn(self, arg):
+        stack = self.stack
+        stack[-1] = stack[stack[-1]]
+
+    def op_storen(self, arg):
+        stack = self.stack
+        address = stack.pop()
+        value = stack.pop()
+        stack[address] = value
+
+    def op_swap(self, arg):
+        stack = self.stack
+        stack[-1], stack[-2] = stack[-2], stack[-1]
+
+    # Heap: ALLOC n deixa no topo o endereço de um bloco novo de n posições;
+    # LOAD n e STORE n acedem à posição n a partir do endereço na pilha
+    def op_alloc(self, arg):
+        self.stack.append(len(self.heap))
+        self.heap.extend([0] * arg)
+
+    def op_padd(self, arg):
+        self.binary(lambda a, b: a + b)
+
+    def op_load(self, arg):
+        stack = self.stack
+        stack[-1] = self.heap[stack[-1] + arg]
+
+    def op_store(self, arg):
+        stack = self.stack
+        value = stack.pop()
+        address = stack.pop()
+        self.heap[address + arg] = value
+
+    # Entrada e saída
+    def op_read(self, arg):
+        line = self.stdin.readline()
+        self.stack.append(line.rstrip('\n'))
+
+    def op_atoi(self, arg):
+        self.stack[-1] = int(self.stack[-1])
+
+    def op_atof(self, arg):
+        self.stack[-1] = float(self.stack[-1])
+
+    def op_writes(self, arg):
+        self.stdout.write(str(self.stack.pop()))
+
+    def op_writei(self, arg):
+        self.stdout.write(str(self.stack.pop()))
+
+    def op_writef(self, arg):
+        self.stdout.write(repr(float(self.stack.pop())))
+
+    def op_writeln(self, arg):
+        self.stdout.write('\n')
+
+    # Aritmética
+    def op_add(self, arg):
+        self.binary(lambda a, b: a + b)
+
+    def op_sub(self, arg):
+        self.binary(lambda a, b: a - b)
+
+    def op_mul(self, arg):
+        self.binary(lambda a, b: a * b)
+
+    def op_div(self, arg):
+        if self.stack[-1] == 0:
+            raise VMError(f"Divisão por zero, instrução {self.pc - 1}")
+        self.binary(int_div)
+
+    def op_mod(self, arg):
+        if self.stack[-1] == 0:
+            raise VMError(f"Divisão por zero, instrução {self.pc - 1}")
+        self.binary(int_mod)
+
+    def op_fadd(self, arg):
+        self.binary(lambda a, b: float(a) + float(b))
+
+    def op_fsub(self, arg):
+        self.binary(lambda a, b: float(a) - float(b))
+
+    def op_fmul(self, arg):
+        self.binary(lambda a, b: float(a) * float(b))
+
+    def op_fdiv(self, arg):
+        if self.stack[-1] == 0:
+            raise VMError(f"Divisão por zero, instrução {self.pc - 1}")
+        self.binary(lambda a, b: float(a) / float(b))
+
+    # Comparações e operações lógicas (verdadeiro é 1, falso é 0)
+    def op_equal(self, arg):
+        self.binary(lambda a, b: int(a == b))
+
+    def op_not(self, arg):
+        self.stack[-1] = int(self.stack[-1] == 0)
+
+    def op_and(self, arg):
+        self.binary(lambda a, b: int(a != 0 and b != 0))
+
+    def op_or(self, arg):
+        self.binary(lambda a, b: int(a != 0 or b != 0))
+
+    def op_inf(self, arg):
+        self.binary(lambda a, b: int(a < b))
+
+    def op_infeq(self, arg):
+        self.binary(lambda a, b: int(a <= b))
+
+    def op_sup(self, arg):
+        self.binary(lambda a, b: int(a > b))
+
+    def op_supeq(self, arg):
+        self.binary(lambda a, b: int(a >= b))
+
+    op_finf = op_inf
+    op_finfeq = op_infeq
+    op_fsup = op_sup
+    op_fsupeq = op_supeq
+
+    # Saltos e procedimentos
+    def op_jump(self, arg):
+        self.pc = arg
+
+    def op_jz(self, arg):
+        if self.stack.pop() == 0:
+            self.pc = arg
+
+    def op_pusha(self, arg):
+        self.stack.append(arg)
+
+    def op_call(self, arg):
+        address = self.stack.pop()
+        self.call_stack.append((self.pc, self.fp))
+        self.fp = len(self.stack)
+        self.pc = address
+
+    def op_return(self, arg):
+        if not self.call_stack:
+            raise VMError(f"RETURN fora de um procedimento, instrução {self.pc - 1}")
+        self.pc, self.fp = self.call_stack.pop()
+
+    # Erro de execução gerado pelo compilador (por exemplo, índice fora dos limites)
+    def op_err(self, arg):
+        raise VMError(self.program.constants[arg])
+
+
+# Função para executar código VM (texto ou lista de linhas)
+def run(code, stdin=None, stdout=None):
+    return load(code).run(stdin, stdout)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Interpretador local de código EWVM")
+    arg_parser.add_argument("ficheiro", nargs="?", default="cod_vm.txt",
+                            help="código VM a executar, em texto ou bytecode (cod_vm.txt por omissão)")
+    arg_parser.add_argument("--time", action="store_true", help="mostrar o tempo de execução em stderr")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        program = load_file(args.ficheiro)
+        start = time.perf_counter()
+        steps = program.run()
+    except VMError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    if args.time:
+        elapsed = time.perf_counter() - start
+        print(f"{steps} instruções, {elapsed:.3f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()